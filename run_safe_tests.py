@@ -6,13 +6,19 @@ Orchestrates safe testing of SpiralLogic components with comprehensive monitorin
 """
 
 import os
+import io
 import sys
+import signal
 import subprocess
+import threading
 import json
 import time
+import importlib
+from contextlib import redirect_stdout, redirect_stderr
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Force UTF-8 encoding
 if hasattr(sys.stdout, 'reconfigure'):
@@ -21,75 +27,157 @@ if hasattr(sys.stderr, 'reconfigure'):
     sys.stderr.reconfigure(encoding='utf-8')
 os.environ.setdefault('PYTHONIOENCODING', 'utf-8')
 
+@dataclass
+class TestResult:
+    """Outcome of a single test, or of a group of sub-tests"""
+    success: bool = False
+    timeout: bool = False
+    execution_time: Optional[float] = None
+    returncode: Optional[int] = None
+    output: str = ''
+    error: str = ''
+    details: Dict[str, Any] = field(default_factory=dict)
+    subtests: Dict[str, 'TestResult'] = field(default_factory=dict)
+
 class SafeTestRunner:
     """Safe test runner for SpiralLogic components"""
     
     def __init__(self):
         self.test_results = {}
         self.start_time = datetime.now()
-        self.log_file = Path.cwd() / f"safe_test_log_{self.start_time.strftime('%Y%m%d_%H%M%S')}.json"
+        self.cwd = Path.cwd()
+        self._present = set()
+        self._refresh_present()
+        self.start_stamp = self.start_time.strftime('%Y%m%d_%H%M%S')
+        self.start_str = self.start_time.strftime('%Y-%m-%d %H:%M:%S')
+        self.log_file = self.cwd / f"safe_test_log_{self.start_stamp}.json"
+    
+    def _refresh_present(self):
+        """Re-list the working directory (after steps that create files)"""
+        self._present = {entry.name for entry in os.scandir(self.cwd) if entry.is_file()}
         
-    def run_subprocess_safe(self, script_name: str, timeout: float = 60.0) -> Dict[str, Any]:
-        """Run a Python script in a subprocess with timeout"""
-        script_path = Path.cwd() / script_name
+    def run_main_inprocess(self, module_name: str, argv: List[str], timeout: float = 30.0) -> Dict[str, Any]:
+        """Call a SpiralLogic module's main(argv) in-process, capturing output
+        
+        main() runs on a daemon watchdog thread, so a call that hangs is
+        reported as a timeout instead of blocking the runner. The runner
+        cannot kill that thread: it keeps running after the timeout, with
+        output no longer captured. Use this only for checks that just print
+        (--help); anything that compiles or writes files goes through _spawn.
+        """
+        if str(self.cwd) not in sys.path:
+            sys.path.insert(0, str(self.cwd))
+        
+        outcome = {'returncode': -1}
+        
+        def call_main():
+            try:
+                module = importlib.import_module(module_name)
+                outcome['returncode'] = module.main(argv) or 0
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    outcome['returncode'] = e.code or 0
+                else:
+                    outcome['returncode'] = 1
+            except BaseException as e:
+                outcome['exception'] = e
+        
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            worker = threading.Thread(target=call_main, name=f"{module_name}.main", daemon=True)
+            worker.start()
+            worker.join(timeout)
         
-        if not script_path.exists():
+        if worker.is_alive():
             return {
-                'success': False,
-                'error': f"Script not found: {script_name}",
-                'output': '',
-                'execution_time': 0
+                'returncode': -1,
+                'stdout': stdout.getvalue(),
+                'stderr': stderr.getvalue() + f"main() timeout after {timeout}s",
+                'timeout': True
             }
         
+        if 'exception' in outcome:
+            raise outcome['exception']
+        
+        return {
+            'returncode': outcome['returncode'],
+            'stdout': stdout.getvalue(),
+            'stderr': stderr.getvalue(),
+            'timeout': False
+        }
+        
+    def _spawn(self, args: List[str], timeout: float, input: Optional[str] = None) -> subprocess.CompletedProcess:
+        """Run a Python subprocess in its own session, killing the whole group on timeout"""
+        proc = subprocess.Popen(
+            [sys.executable] + args,
+            stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            start_new_session=True
+        )
+        try:
+            stdout, stderr = proc.communicate(input, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            if hasattr(os, 'killpg'):
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            else:
+                proc.kill()
+            proc.communicate()
+            raise
+        return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+    
+    def run_subprocess_safe(self, script_name: str, timeout: float = 60.0) -> TestResult:
+        """Run a Python script in a subprocess with timeout"""
+        script_path = self.cwd / script_name
+        
+        if script_name not in self._present:
+            return TestResult(
+                error=f"Script not found: {script_name}",
+                execution_time=0.0
+            )
+        
         print(f"🚀 Running {script_name} (timeout: {timeout}s)")
         
         start_time = time.time()
         
         try:
             # Run script in subprocess
-            result = subprocess.run(
-                [sys.executable, str(script_path)],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                encoding='utf-8',
-                errors='replace'
-            )
+            result = self._spawn([str(script_path)], timeout)
             
             execution_time = time.time() - start_time
             
-            return {
-                'success': result.returncode == 0,
-                'returncode': result.returncode,
-                'output': result.stdout,
-                'error': result.stderr,
-                'execution_time': execution_time,
-                'timeout': False
-            }
+            return TestResult(
+                success=result.returncode == 0,
+                returncode=result.returncode,
+                output=result.stdout,
+                error=result.stderr,
+                execution_time=execution_time
+            )
             
         except subprocess.TimeoutExpired:
             execution_time = time.time() - start_time
-            return {
-                'success': False,
-                'returncode': -1,
-                'output': '',
-                'error': f"Process timeout after {timeout}s",
-                'execution_time': execution_time,
-                'timeout': True
-            }
+            return TestResult(
+                returncode=-1,
+                error=f"Process timeout after {timeout}s",
+                execution_time=execution_time,
+                timeout=True
+            )
             
         except Exception as e:
             execution_time = time.time() - start_time
-            return {
-                'success': False,
-                'returncode': -1,
-                'output': '',
-                'error': str(e),
-                'execution_time': execution_time,
-                'timeout': False
-            }
+            return TestResult(
+                returncode=-1,
+                error=str(e),
+                execution_time=execution_time
+            )
     
-    def test_basic_cli(self) -> Dict[str, Any]:
+    def test_basic_cli(self) -> TestResult:
         """Test basic SpiralLogic CLI functionality"""
         print("\n📋 Testing Basic CLI Functionality")
         print("-" * 40)
@@ -98,90 +186,82 @@ class SafeTestRunner:
         
         # Test 1: CLI help
         try:
-            result = subprocess.run(
-                [sys.executable, 'spirallogic_cli.py', '--help'],
-                capture_output=True,
-                text=True,
-                timeout=10.0,
-                encoding='utf-8',
-                errors='replace'
-            )
+            result = self.run_main_inprocess('spirallogic_cli', ['--help'], timeout=10.0)
             
-            results['cli_help'] = {
-                'success': result.returncode == 0,
-                'output_length': len(result.stdout),
-                'has_usage': 'usage:' in result.stdout.lower() or 'Usage:' in result.stdout
-            }
+            results['cli_help'] = TestResult(
+                success=result['returncode'] == 0,
+                returncode=result['returncode'],
+                timeout=result['timeout'],
+                details={
+                    'output_length': len(result['stdout']),
+                    'has_usage': 'usage:' in result['stdout'].lower() or 'Usage:' in result['stdout']
+                }
+            )
             
-            if results['cli_help']['success']:
+            if results['cli_help'].success:
                 print("✅ CLI help works")
             else:
                 print("❌ CLI help failed")
                 
         except Exception as e:
-            results['cli_help'] = {'success': False, 'error': str(e)}
+            results['cli_help'] = TestResult(error=str(e))
             print(f"❌ CLI help error: {e}")
         
-        # Test 2: Create example
+        # Test 2: Create example (runs the compiler, so in a killable subprocess)
         try:
-            result = subprocess.run(
-                [sys.executable, 'spirallogic_cli.py', 'create', 'hello'],
-                capture_output=True,
-                text=True,
-                timeout=15.0,
-                encoding='utf-8',
-                errors='replace'
-            )
+            result = self._spawn(['spirallogic_cli.py', 'create', 'hello'], timeout=15.0)
+            self._refresh_present()
             
-            results['create_example'] = {
-                'success': result.returncode == 0,
-                'output': result.stdout,
-                'error': result.stderr,
-                'hello_file_created': Path('hello.spiral').exists()
-            }
+            results['create_example'] = TestResult(
+                success=result.returncode == 0,
+                returncode=result.returncode,
+                output=result.stdout,
+                error=result.stderr,
+                details={'hello_file_created': 'hello.spiral' in self._present}
+            )
             
-            if results['create_example']['success']:
+            if results['create_example'].success:
                 print("✅ Example creation works")
             else:
                 print("❌ Example creation failed")
                 
+        except subprocess.TimeoutExpired:
+            results['create_example'] = TestResult(
+                returncode=-1, error="Process timeout after 15.0s", timeout=True)
+            print("❌ Example creation timed out")
         except Exception as e:
-            results['create_example'] = {'success': False, 'error': str(e)}
+            results['create_example'] = TestResult(error=str(e))
             print(f"❌ Create example error: {e}")
         
         # Test 3: Run hello.spiral if it exists
-        hello_file = Path('hello.spiral')
-        if hello_file.exists():
+        if 'hello.spiral' in self._present:
             try:
-                result = subprocess.run(
-                    [sys.executable, 'spirallogic_cli.py', 'run', 'hello.spiral'],
-                    capture_output=True,
-                    text=True,
+                result = self._spawn(
+                    ['spirallogic_cli.py', 'run', 'hello.spiral'],
                     timeout=20.0,
-                    encoding='utf-8',
-                    errors='replace',
                     input='\n'.join(['Test User', 'quit', 'exit'])  # Provide input for interactive parts
                 )
                 
-                results['run_hello'] = {
-                    'success': result.returncode == 0,
-                    'output': result.stdout,
-                    'error': result.stderr,
-                    'has_output': len(result.stdout) > 0
-                }
+                results['run_hello'] = TestResult(
+                    success=result.returncode == 0,
+                    returncode=result.returncode,
+                    output=result.stdout,
+                    error=result.stderr,
+                    details={'has_output': len(result.stdout) > 0}
+                )
                 
-                if results['run_hello']['success']:
+                if results['run_hello'].success:
                     print("✅ Running hello.spiral works")
                 else:
                     print("❌ Running hello.spiral failed")
                     
             except Exception as e:
-                results['run_hello'] = {'success': False, 'error': str(e)}
+                results['run_hello'] = TestResult(error=str(e))
                 print(f"❌ Run hello error: {e}")
         
-        return results
+        return TestResult(success=all(r.success for r in results.values()), subtests=results)
     
-    def test_emoji_bridge_basic(self) -> Dict[str, Any]:
+    def test_emoji_bridge_basic(self) -> TestResult:
         """Test basic emoji bridge functionality"""
         print("\n🎭 Testing Emoji Bridge Basic Functionality")
         print("-" * 40)
@@ -190,68 +270,64 @@ class SafeTestRunner:
         
         # Test 1: Emoji bridge help
         try:
-            result = subprocess.run(
-                [sys.executable, 'spirallogic_emoji_bridge.py', '--help'],
-                capture_output=True,
-                text=True,
-                timeout=10.0,
-                encoding='utf-8',
-                errors='replace'
-            )
+            result = self.run_main_inprocess('spirallogic_emoji_bridge', ['--help'], timeout=10.0)
             
-            results['emoji_help'] = {
-                'success': result.returncode == 0,
-                'output_length': len(result.stdout),
-                'has_usage': 'usage:' in result.stdout.lower() or 'Usage:' in result.stdout
-            }
+            results['emoji_help'] = TestResult(
+                success=result['returncode'] == 0,
+                returncode=result['returncode'],
+                timeout=result['timeout'],
+                details={
+                    'output_length': len(result['stdout']),
+                    'has_usage': 'usage:' in result['stdout'].lower() or 'Usage:' in result['stdout']
+                }
+            )
             
-            if results['emoji_help']['success']:
+            if results['emoji_help'].success:
                 print("✅ Emoji bridge help works")
             else:
                 print("❌ Emoji bridge help failed")
                 
         except Exception as e:
-            results['emoji_help'] = {'success': False, 'error': str(e)}
+            results['emoji_help'] = TestResult(error=str(e))
             print(f"❌ Emoji help error: {e}")
         
-        # Test 2: Create examples
+        # Test 2: Create examples (runs the compiler, so in a killable subprocess)
         try:
-            result = subprocess.run(
-                [sys.executable, 'spirallogic_emoji_bridge.py', '--examples'],
-                capture_output=True,
-                text=True,
-                timeout=15.0,
-                encoding='utf-8',
-                errors='replace'
-            )
+            result = self._spawn(['spirallogic_emoji_bridge.py', '--examples'], timeout=15.0)
+            self._refresh_present()
             
-            results['emoji_examples'] = {
-                'success': result.returncode == 0,
-                'output': result.stdout,
-                'error': result.stderr,
-                'files_created': [
-                    Path('emoji_anger_processing.spiral').exists(),
-                    Path('emoji_grief_support.spiral').exists(),
-                    Path('emoji_anxiety_management.spiral').exists()
-                ]
-            }
+            results['emoji_examples'] = TestResult(
+                success=result.returncode == 0,
+                returncode=result.returncode,
+                output=result.stdout,
+                error=result.stderr,
+                details={'files_created': [
+                    'emoji_anger_processing.spiral' in self._present,
+                    'emoji_grief_support.spiral' in self._present,
+                    'emoji_anxiety_management.spiral' in self._present
+                ]}
+            )
             
-            if results['emoji_examples']['success']:
+            if results['emoji_examples'].success:
                 print("✅ Emoji examples creation works")
             else:
                 print("❌ Emoji examples creation failed")
                 
+        except subprocess.TimeoutExpired:
+            results['emoji_examples'] = TestResult(
+                returncode=-1, error="Process timeout after 15.0s", timeout=True)
+            print("❌ Emoji examples creation timed out")
         except Exception as e:
-            results['emoji_examples'] = {'success': False, 'error': str(e)}
+            results['emoji_examples'] = TestResult(error=str(e))
             print(f"❌ Emoji examples error: {e}")
         
-        return results
+        return TestResult(success=all(r.success for r in results.values()), subtests=results)
     
-    def run_comprehensive_tests(self) -> Dict[str, Any]:
+    def run_comprehensive_tests(self) -> Dict[str, TestResult]:
         """Run comprehensive test suite"""
         print("🔬 COMPREHENSIVE SPIRALLOGIC TESTING")
         print("=" * 50)
-        print(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Started: {self.start_str}")
         print()
         
         all_results = {}
@@ -268,11 +344,11 @@ class SafeTestRunner:
         sandbox_result = self.run_subprocess_safe('spirallogic_sandbox.py', timeout=120.0)
         all_results['sandbox_tests'] = sandbox_result
         
-        if sandbox_result['success']:
+        if sandbox_result.success:
             print("✅ Sandbox tests completed successfully")
         else:
             print("❌ Sandbox tests failed")
-            if sandbox_result['timeout']:
+            if sandbox_result.timeout:
                 print("⚠️ Sandbox tests timed out")
         
         # Test 4: Emoji bridge debugging
@@ -281,22 +357,22 @@ class SafeTestRunner:
         debug_result = self.run_subprocess_safe('emoji_bridge_debugger.py', timeout=90.0)
         all_results['emoji_debug'] = debug_result
         
-        if debug_result['success']:
+        if debug_result.success:
             print("✅ Emoji bridge debugging completed successfully")
         else:
             print("❌ Emoji bridge debugging failed")
-            if debug_result['timeout']:
+            if debug_result.timeout:
                 print("⚠️ Emoji bridge debugging timed out")
         
         return all_results
     
-    def generate_summary_report(self, results: Dict[str, Any]) -> str:
+    def generate_summary_report(self, results: Dict[str, TestResult]) -> str:
         """Generate summary report of all tests"""
         report = []
         report.append("🔬 SPIRALLOGIC COMPREHENSIVE TEST REPORT")
         report.append("=" * 60)
         report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        report.append(f"Started: {self.start_str}")
         report.append("")
         
         # Overall summary
@@ -304,12 +380,11 @@ class SafeTestRunner:
         successful_groups = 0
         timeouts = 0
         
-        for group_name, group_result in results.items():
-            if isinstance(group_result, dict):
-                if group_result.get('success', False):
-                    successful_groups += 1
-                if group_result.get('timeout', False):
-                    timeouts += 1
+        for group_result in results.values():
+            if group_result.success:
+                successful_groups += 1
+            if group_result.timeout:
+                timeouts += 1
         
         report.append("OVERALL SUMMARY")
         report.append("-" * 20)
@@ -324,25 +399,23 @@ class SafeTestRunner:
         report.append("-" * 20)
         
         for group_name, group_result in results.items():
-            status = "✅ PASS" if group_result.get('success', False) else "❌ FAIL"
+            status = "✅ PASS" if group_result.success else "❌ FAIL"
             report.append(f"{status} {group_name}")
             
-            if group_result.get('timeout', False):
+            if group_result.timeout:
                 report.append("  ⚠️ TIMEOUT detected")
             
-            if 'execution_time' in group_result:
-                report.append(f"  Execution time: {group_result['execution_time']:.2f}s")
+            if group_result.execution_time is not None:
+                report.append(f"  Execution time: {group_result.execution_time:.2f}s")
             
-            if not group_result.get('success', False) and 'error' in group_result:
-                error_preview = str(group_result['error'])[:100]
+            if not group_result.success and group_result.error:
+                error_preview = group_result.error[:100]
                 report.append(f"  Error: {error_preview}...")
             
-            # Sub-test details for basic tests
-            if group_name in ['basic_cli', 'basic_emoji']:
-                for sub_test, sub_result in group_result.items():
-                    if isinstance(sub_result, dict) and 'success' in sub_result:
-                        sub_status = "✅" if sub_result['success'] else "❌"
-                        report.append(f"    {sub_status} {sub_test}")
+            # Sub-test details for grouped tests
+            for sub_test, sub_result in group_result.subtests.items():
+                sub_status = "✅" if sub_result.success else "❌"
+                report.append(f"    {sub_status} {sub_test}")
             
             report.append("")
         
@@ -357,10 +430,10 @@ class SafeTestRunner:
             report.append("✅ No timeouts detected")
         
         # Check for specific infinite loop indicators
-        emoji_debug = results.get('emoji_debug', {})
-        if 'output' in emoji_debug and 'infinite loop' in emoji_debug['output'].lower():
+        emoji_debug = results.get('emoji_debug', TestResult())
+        if 'infinite loop' in emoji_debug.output.lower():
             report.append("⚠️ Infinite loop detected in emoji bridge")
-        elif emoji_debug.get('success', False):
+        elif emoji_debug.success:
             report.append("✅ No infinite loops detected in emoji bridge")
         
         report.append("")
@@ -390,20 +463,21 @@ class SafeTestRunner:
         
         return "\n".join(report)
     
-    def save_results(self, results: Dict[str, Any]):
+    def save_results(self, results: Dict[str, TestResult]):
         """Save test results to file"""
         test_data = {
             'timestamp': self.start_time.isoformat(),
-            'test_results': results,
+            'test_results': {name: asdict(r) for name, r in results.items()},
             'summary': {
                 'total_groups': len(results),
-                'successful_groups': sum(1 for r in results.values() if r.get('success', False)),
-                'timeouts': sum(1 for r in results.values() if r.get('timeout', False))
+                'successful_groups': sum(1 for r in results.values() if r.success),
+                'timeouts': sum(1 for r in results.values() if r.timeout)
             }
         }
         
         with open(self.log_file, 'w', encoding='utf-8') as f:
-            json.dump(test_data, f, indent=2, ensure_ascii=False)
+            # Compact separators: this log is for tools, the .txt report is for people
+            json.dump(test_data, f, ensure_ascii=False, separators=(',', ':'))
         
         print(f"\n💾 Test results saved to: {self.log_file}")
 
@@ -429,7 +503,7 @@ def main():
         runner.save_results(results)
         
         # Save report to file
-        report_file = Path.cwd() / f"spirallogic_test_report_{runner.start_time.strftime('%Y%m%d_%H%M%S')}.txt"
+        report_file = runner.cwd / f"spirallogic_test_report_{runner.start_stamp}.txt"
         with open(report_file, 'w', encoding='utf-8') as f:
             f.write(report)
         
@@ -437,7 +511,7 @@ def main():
         
         # Determine exit code
         total_groups = len(results)
-        successful_groups = sum(1 for r in results.values() if r.get('success', False))
+        successful_groups = sum(1 for r in results.values() if r.success)
         
         if successful_groups == total_groups:
             print("\n✅ All tests passed - SpiralLogic appears safe for use")
@@ -8,77 +8,267 @@ Built using SpiralLogic's trauma-informed consciousness architecture
 
 import sys
 import os
+import re
 import time
 import random
+import functools
 import unicodedata
+from collections import Counter, deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
 
-# Force UTF-8 everywhere
-if hasattr(sys.stdout, 'reconfigure'):
-    sys.stdout.reconfigure(encoding='utf-8')
-if hasattr(sys.stderr, 'reconfigure'):
-    sys.stderr.reconfigure(encoding='utf-8')
+# Force UTF-8 everywhere, touching only streams that aren't UTF-8 already
+for _stream in (sys.stdout, sys.stderr):
+    if (hasattr(_stream, 'reconfigure')
+            and (_stream.encoding or '').lower().replace('_', '-') not in ('utf-8', 'utf8')):
+        _stream.reconfigure(encoding='utf-8')
+del _stream
 os.environ.setdefault('PYTHONIOENCODING', 'utf-8')
 
-# Import our SpiralLogic components
-from spirallogic_emoji_bridge import SpiralLogicEmojiCompiler
+# Typing-effect chunks: an ASCII word with its leading blanks, or one
+# character together with its combining marks, variation selectors,
+# skin tones and zero-width-joined followers
+TYPING_CHUNK_RE = re.compile(
+    r'[ \t]*[!-~]+'
+    r'|.[\u0300-\u036f\ufe0e\ufe0f\U0001f3fb-\U0001f3ff]*'
+    r'(?:\u200d.[\u0300-\u036f\ufe0e\ufe0f\U0001f3fb-\U0001f3ff]*)*',
+    re.S
+)
+
+# Emoji categories used for emotional analysis
+ANGER_EMOJI = frozenset("🔥😡💢⚡🌋")
+SADNESS_EMOJI = frozenset("💧😢😭🌧️💔")
+FEAR_EMOJI = frozenset("😰😨🕷️⚡🌪️")
+JOY_EMOJI = frozenset("😊🌞✨🌈🦋")
+LOVE_EMOJI = frozenset("❤️💜💙💚🫀")
+INTENSITY_EMOJI = frozenset("⚡🚨💥🌪️🔥")
+SAFETY_EMOJI = frozenset("🛡️🏠🫂🧸🌙")
+
+# Tally slots, in the order analyze_emotional_content reads them
+EMOTION_NAMES = ('anger', 'sadness', 'fear', 'joy', 'love')
+INTENSITY_SLOT = len(EMOTION_NAMES)
+SAFETY_SLOT = INTENSITY_SLOT + 1
+
+# Character → tally slots it counts towards, so classifying a character
+# is one dict lookup rather than seven set probes
+EMOJI_SLOTS: Dict[str, Tuple[int, ...]] = {}
+for _slot, _members in enumerate((ANGER_EMOJI, SADNESS_EMOJI, FEAR_EMOJI, JOY_EMOJI,
+                                  LOVE_EMOJI, INTENSITY_EMOJI, SAFETY_EMOJI)):
+    for _char in _members:
+        EMOJI_SLOTS[_char] = EMOJI_SLOTS.get(_char, ()) + (_slot,)
+del _slot, _members, _char
+
+# Gentle responses when no specific healing pattern applies
+DEFAULT_RESPONSES = ("💜🌱✨", "🫂💙🌙", "🌀💚🕊️")
+
+# Most recent interactions kept in the session log
+SESSION_LOG_LIMIT = 1000
+
+# Dashboard bars for a 0-10 value at two points per dot
+DASHBOARD_BARS = tuple('🟢' * filled + '⚪' * (5 - filled) for filled in range(6))
+
+# Static help screens, normalized once at import
+HELP_TEXT = unicodedata.normalize('NFC', (
+    "\n🌀 SpiralLogic Terminal Help 🌀\n"
+    "========================================\n"
+    "Express emotions with emojis and receive therapeutic responses\n"
+    "\n"
+    "💡 Emoji Examples:\n"
+    "  🔥🧠⚡🗯️    - Anger processing sequence\n"
+    "  💧🫀🌙✨    - Grief support ritual\n"
+    "  😰🛡️💪🏽⭐   - Anxiety to empowerment\n"
+    "  🌱💚🦋🌟    - Growth and transformation\n"
+    "  🫂💜🌈🕊️    - Connection and peace\n"
+    "\n"
+    "🎮 Commands:\n"
+    "  help, h, ?     - Show this help\n"
+    "  shortcuts, sc  - Show text shortcuts\n"
+    "  status, s      - Show emotional state\n"
+    "  debug          - Toggle debug mode\n"
+    "  quit, q        - Exit terminal\n"
+    "\n"
+    "⚡ Quick Examples:\n"
+    "  angry          → Anger processing ritual\n"
+    "  sad            → Grief support sequence\n"
+    "  overwhelmed    → Complex state processing\n"
+    "  heal           → Healing transformation\n"
+))
+
+SHORTCUTS_TEXT = unicodedata.normalize('NFC', (
+    "\n🎯 Text Shortcuts → Emoji Sequences\n"
+    "==================================================\n"
+    "🔥 Emotions:\n"
+    "  angry, mad, rage  → 🔥🧠⚡🗯️\n"
+    "  sad, grief, cry   → 💧🫀🌙✨\n"
+    "  scared, anxiety   → 😰🛡️💪🏽⭐\n"
+    "  happy, joy        → 😊🌞✨🌈\n"
+    "\n"
+    "🌀 Complex States:\n"
+    "  overwhelmed       → 🌪️🧠💥😰\n"
+    "  tired             → 😴🌙💤🛌\n"
+    "  confused, stuck   → ❓🧠🌀💭\n"
+    "  empty, numb       → 🕳️🌑💭🌬️\n"
+    "\n"
+    "✨ Healing:\n"
+    "  heal              → 🌱💚🦋🌟\n"
+    "  peace             → 🕊️💙🌙✨\n"
+    "  strength          → 💪🏽🦁⭐🔥\n"
+    "  breathe           → 🌬️💙🌊🕊️\n"
+    "\n"
+    "🏰 Voice Summons:\n"
+    "  healer            → 🏰🧠💚✨\n"
+    "  protector         → 🏰🛡️💪🏽⚡\n"
+    "  nurturer          → 🏰🫂💜🌙\n"
+))
 
-@dataclass
 class EmotionalState:
     """Current emotional bandwidth tracking"""
-    energy: float = 5.0      # 0-10 scale
-    safety: float = 7.0      # 0-10 scale  
-    clarity: float = 6.0     # 0-10 scale
-    connection: float = 5.0  # 0-10 scale
-    timestamp: datetime = None
+    __slots__ = ('energy', 'safety', 'clarity', 'connection', 'timestamp')
     
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    def __init__(self, energy: float = 5.0, safety: float = 7.0, clarity: float = 6.0,
+                 connection: float = 5.0, timestamp: Optional[datetime] = None):
+        self.energy = energy          # 0-10 scale
+        self.safety = safety          # 0-10 scale
+        self.clarity = clarity        # 0-10 scale
+        self.connection = connection  # 0-10 scale
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
+    
+    def __repr__(self):
+        return (f"EmotionalState(energy={self.energy!r}, safety={self.safety!r}, "
+                f"clarity={self.clarity!r}, connection={self.connection!r}, "
+                f"timestamp={self.timestamp!r})")
 
 class SpiralTerminal:
     """Interactive therapeutic terminal powered by emoji programming"""
     
     def __init__(self):
-        self.emoji_compiler = SpiralLogicEmojiCompiler()
         self.emotional_state = EmotionalState()
-        self.session_log = []
+        self.session_log = deque(maxlen=SESSION_LOG_LIMIT)
+        self.interaction_count = 0
         self.running = True
         self.debug_mode = False
+        self.rng = random.Random()
+        
+        # Terminal commands
+        self.commands = {
+            'quit': self.quit_session, 'exit': self.quit_session, 'q': self.quit_session,
+            'help': self.show_help, 'h': self.show_help, '?': self.show_help,
+            'status': self.show_emotional_dashboard, 'state': self.show_emotional_dashboard,
+            's': self.show_emotional_dashboard,
+            'debug': self.toggle_debug,
+            'shortcuts': self.show_shortcuts, 'sc': self.show_shortcuts,
+        }
+        
+        # Compilation and analysis are pure in the input, so repeated
+        # sequences (shortcuts especially) are served from a per-terminal cache
+        self.analyze_cached = functools.lru_cache(maxsize=256)(self.compile_and_analyze)
         
         # Therapeutic responses in emoji patterns
         self.healing_patterns = {
-            "🔥": ["🌊💙🕊️", "🧘‍♀️🌱✨", "🫀💜🦋"],  # Anger → cooling/transformation
-            "💧": ["🌅💛🌻", "🤗💚🌿", "🕯️🧡🦋"],  # Grief → gentle warmth
-            "😰": ["🛡️💪🏽⭐", "🏠💝🌈", "🧸💜🌙"],  # Anxiety → protection/safety
-            "🖤": ["🌱💚🌍", "☀️💛🦋", "🫂💙✨"],  # Depression → growth/connection
-            "😡": ["🌬️💙🕊️", "🧘‍♀️🌸💜", "🏔️🌊🌙"],  # Rage → breath/space
+            "🔥": ("🌊💙🕊️", "🧘‍♀️🌱✨", "🫀💜🦋"),  # Anger → cooling/transformation
+            "💧": ("🌅💛🌻", "🤗💚🌿", "🕯️🧡🦋"),  # Grief → gentle warmth
+            "😰": ("🛡️💪🏽⭐", "🏠💝🌈", "🧸💜🌙"),  # Anxiety → protection/safety
+            "🖤": ("🌱💚🌍", "☀️💛🦋", "🫂💙✨"),  # Depression → growth/connection
+            "😡": ("🌬️💙🕊️", "🧘‍♀️🌸💜", "🏔️🌊🌙"),  # Rage → breath/space
+        }
+        
+        # Dominant emotion → (trigger emoji, healing patterns)
+        self.emotion_responses = {
+            'anger': (("🔥",), self.healing_patterns["🔥"]),
+            'sadness': (("💧",), self.healing_patterns["💧"]),
+            'fear': (("😰", "😨"), self.healing_patterns["😰"]),
+        }
+        
+        # Text shortcuts → emoji sequences
+        self.shortcuts = {
+            # Basic emotions
+            'angry': '🔥🧠⚡🗯️',
+            'anger': '🔥🧠⚡🗯️', 
+            'mad': '🔥🧠⚡🗯️',
+            'rage': '🔥💢⚡🌋',
+            
+            'sad': '💧🫀🌙✨',
+            'grief': '💧🫀🌙✨',
+            'cry': '💧😢🌧️💜',
+            'loss': '💧💔🕯️🕊️',
+            
+            'scared': '😰🛡️💪🏽⭐',
+            'anxiety': '😰🛡️💪🏽⭐',
+            'fear': '😰🕷️⚡🌪️',
+            'panic': '😰🚨💨🛡️',
+            
+            'happy': '😊🌞✨🌈',
+            'joy': '😊🌞✨🌈',
+            'excited': '⚡😊🌟🎉',
+            'love': '❤️💜💙💚',
+            
+            # Complex states
+            'overwhelmed': '🌪️🧠💥😰',
+            'tired': '😴🌙💤🛌',
+            'confused': '❓🧠🌀💭',
+            'stuck': '🪨🔄❓💭',
+            'empty': '🕳️🌑💭🌬️',
+            'numb': '🧊❄️💭🌑',
+            
+            # Healing sequences  
+            'heal': '🌱💚🦋🌟',
+            'peace': '🕊️💙🌙✨',
+            'strength': '💪🏽🦁⭐🔥',
+            'wisdom': '🧠💎🌟📿',
+            'protection': '🛡️🏰💜🌈',
+            'grounding': '🌍🌳👣💚',
+            'breathe': '🌬️💙🌊🕊️',
+            
+            # Voice summons
+            'healer': '🏰🧠💚✨',
+            'protector': '🏰🛡️💪🏽⚡',
+            'nurturer': '🏰🫂💜🌙',
+            'keeper': '🏰🧠💔🕯️',
+            'warrior': '🏰⚔️🔥👑',
         }
         
+        # Longest shortcuts first so e.g. 'healer' wins over 'heal'
+        self.shortcut_pattern = re.compile('|'.join(
+            re.escape(shortcut) for shortcut in sorted(self.shortcuts, key=len, reverse=True)
+        ))
+        
+    @functools.cached_property
+    def emoji_compiler(self):
+        """SpiralLogic emoji compiler, imported on first use so the banner shows sooner"""
+        from spirallogic_emoji_bridge import SpiralLogicEmojiCompiler
+        return SpiralLogicEmojiCompiler()
+    
     def safe_print(self, message: str, delay: float = 0.03):
         """Print with Unicode safety and optional typing effect"""
-        normalized = unicodedata.normalize('NFC', str(message))
+        text = str(message)
+        if text.isascii() or unicodedata.is_normalized('NFC', text):
+            normalized = text
+        else:
+            normalized = unicodedata.normalize('NFC', text)
         
-        if delay > 0:
-            for char in normalized:
-                print(char, end='', flush=True)
+        if delay > 0 and sys.stdout.isatty():
+            write = sys.stdout.write
+            flush = sys.stdout.flush
+            for chunk in TYPING_CHUNK_RE.findall(normalized):
+                write(chunk)
+                flush()
                 time.sleep(delay)
             print()
         else:
             print(normalized)
     
+    def compile_and_analyze(self, emoji_sequence: str) -> Tuple[str, Dict[str, Any]]:
+        """Compile emoji to SpiralLogic and extract emotional data"""
+        spiral_code = self.emoji_compiler.compile_emoji_ritual(emoji_sequence)
+        emotional_analysis = self.analyze_emotional_content(emoji_sequence)
+        return spiral_code, emotional_analysis
+    
     def process_emoji_input(self, emoji_sequence: str) -> Dict[str, Any]:
         """Process emoji input through SpiralLogic compiler"""
         try:
-            # Compile emoji to SpiralLogic
-            spiral_code = self.emoji_compiler.compile_emoji_ritual(emoji_sequence)
+            spiral_code, emotional_analysis = self.analyze_cached(emoji_sequence)
             
-            # Extract emotional data
-            emotional_analysis = self.analyze_emotional_content(emoji_sequence)
-            
-            # Generate therapeutic response
+            # Generate therapeutic response (fresh each time)
             response = self.generate_therapeutic_response(emoji_sequence, emotional_analysis)
             
             return {
@@ -86,7 +276,7 @@ class SpiralTerminal:
                 'spiral_code': spiral_code,
                 'emotional_data': emotional_analysis,
                 'response': response,
-                'timestamp': datetime.now()
+                'timestamp': time.monotonic_ns()  # ordering only, never displayed
             }
             
         except Exception as e:
@@ -94,32 +284,37 @@ class SpiralTerminal:
                 'input': emoji_sequence,
                 'error': str(e),
                 'response': "🌀 Processing... let me try again gently 💜",
-                'timestamp': datetime.now()
+                'timestamp': time.monotonic_ns()
             }
     
     def analyze_emotional_content(self, emoji_sequence: str) -> Dict[str, Any]:
         """Analyze emotional content of emoji sequence"""
         
-        # Emotional categorization
-        emotions = {
-            'anger': len([e for e in emoji_sequence if e in "🔥😡💢⚡🌋"]),
-            'sadness': len([e for e in emoji_sequence if e in "💧😢😭🌧️💔"]),
-            'fear': len([e for e in emoji_sequence if e in "😰😨🕷️⚡🌪️"]),
-            'joy': len([e for e in emoji_sequence if e in "😊🌞✨🌈🦋"]),
-            'love': len([e for e in emoji_sequence if e in "❤️💜💙💚🫀"]),
-        }
+        tally = [0] * (SAFETY_SLOT + 1)
         
-        # Intensity calculation
-        intensity_markers = len([e for e in emoji_sequence if e in "⚡🚨💥🌪️🔥"])
+        # Count each character once, then classify only the distinct ones
+        for e, count in Counter(emoji_sequence).items():
+            slots = EMOJI_SLOTS.get(e)
+            if slots:
+                for slot in slots:
+                    tally[slot] += count
         
-        # Safety indicators
-        safety_markers = len([e for e in emoji_sequence if e in "🛡️🏠🫂🧸🌙"])
+        # Emotional categorization, tracking the first strongest emotion as we go
+        emotions = {}
+        dominant_emotion, dominant_count = 'neutral', 0
+        for name, count in zip(EMOTION_NAMES, tally):
+            emotions[name] = count
+            if count > dominant_count:
+                dominant_emotion, dominant_count = name, count
+        
+        intensity_markers = tally[INTENSITY_SLOT]
+        safety_markers = tally[SAFETY_SLOT]
         
         return {
             'emotions': emotions,
             'intensity': min(10, intensity_markers * 2 + 1),
             'safety_level': max(1, 8 - intensity_markers + safety_markers),
-            'dominant_emotion': max(emotions, key=emotions.get) if any(emotions.values()) else 'neutral'
+            'dominant_emotion': dominant_emotion
         }
     
     def generate_therapeutic_response(self, input_emoji: str, analysis: Dict[str, Any]) -> str:
@@ -128,16 +323,13 @@ class SpiralTerminal:
         dominant_emotion = analysis['dominant_emotion']
         intensity = analysis['intensity']
         
-        # Select healing pattern based on dominant emotion
-        if dominant_emotion == 'anger' and '🔥' in input_emoji:
-            response_options = self.healing_patterns.get('🔥', ["🌊💙🕊️"])
-        elif dominant_emotion == 'sadness' and '💧' in input_emoji:
-            response_options = self.healing_patterns.get('💧', ["🌅💛🌻"])
-        elif dominant_emotion == 'fear' and any(e in input_emoji for e in "😰😨"):
-            response_options = self.healing_patterns.get('😰', ["🛡️💪🏽⭐"])
-        else:
-            # Default gentle responses
-            response_options = ["💜🌱✨", "🫂💙🌙", "🌀💚🕊️"]
+        # Select healing pattern based on dominant emotion, when its trigger is present
+        response_options = DEFAULT_RESPONSES
+        emotion_response = self.emotion_responses.get(dominant_emotion)
+        if emotion_response:
+            triggers, patterns = emotion_response
+            if any(trigger in input_emoji for trigger in triggers):
+                response_options = patterns
         
         # Select response based on intensity
         if intensity > 7:
@@ -147,7 +339,7 @@ class SpiralTerminal:
         else:
             prefix = "💜 Gently holding space... "
         
-        selected_response = random.choice(response_options)
+        selected_response = self.rng.choice(response_options)
         
         return f"{prefix}{selected_response}"
     
@@ -170,102 +362,46 @@ class SpiralTerminal:
     
     def convert_shortcuts(self, text: str) -> str:
         """Convert text shortcuts to emoji sequences"""
-        shortcuts = {
-            # Basic emotions
-            'angry': '🔥🧠⚡🗯️',
-            'anger': '🔥🧠⚡🗯️', 
-            'mad': '🔥🧠⚡🗯️',
-            'rage': '🔥💢⚡🌋',
-            
-            'sad': '💧🫀🌙✨',
-            'grief': '💧🫀🌙✨',
-            'cry': '💧😢🌧️💜',
-            'loss': '💧💔🕯️🕊️',
-            
-            'scared': '😰🛡️💪🏽⭐',
-            'anxiety': '😰🛡️💪🏽⭐',
-            'fear': '😰🕷️⚡🌪️',
-            'panic': '😰🚨💨🛡️',
-            
-            'happy': '😊🌞✨🌈',
-            'joy': '😊🌞✨🌈',
-            'excited': '⚡😊🌟🎉',
-            'love': '❤️💜💙💚',
-            
-            # Complex states
-            'overwhelmed': '🌪️🧠💥😰',
-            'tired': '😴🌙💤🛌',
-            'confused': '❓🧠🌀💭',
-            'stuck': '🪨🔄❓💭',
-            'empty': '🕳️🌑💭🌬️',
-            'numb': '🧊❄️💭🌑',
-            
-            # Healing sequences  
-            'heal': '🌱💚🦋🌟',
-            'peace': '🕊️💙🌙✨',
-            'strength': '💪🏽🦁⭐🔥',
-            'wisdom': '🧠💎🌟📿',
-            'protection': '🛡️🏰💜🌈',
-            'grounding': '🌍🌳👣💚',
-            'breathe': '🌬️💙🌊🕊️',
-            
-            # Voice summons
-            'healer': '🏰🧠💚✨',
-            'protector': '🏰🛡️💪🏽⚡',
-            'nurturer': '🏰🫂💜🌙',
-            'keeper': '🏰🧠💔🕯️',
-            'warrior': '🏰⚔️🔥👑',
-        }
+        lower = text.lower()
         
-        # Convert shortcuts (case insensitive)
-        for shortcut, emoji_seq in shortcuts.items():
-            if text.lower() == shortcut:
-                return emoji_seq
-            # Also handle partial matches
-            text = text.lower().replace(shortcut, emoji_seq)
+        # Exact shortcut (case insensitive)
+        emoji_seq = self.shortcuts.get(lower)
+        if emoji_seq is not None:
+            return emoji_seq
         
-        return text
+        # Also handle partial matches
+        return self.shortcut_pattern.sub(lambda m: self.shortcuts[m.group(0)], lower)
     
     def show_shortcuts(self):
         """Show available text shortcuts"""
-        self.safe_print("\n🎯 Text Shortcuts → Emoji Sequences")
-        self.safe_print("="*50)
-        self.safe_print("🔥 Emotions:")
-        self.safe_print("  angry, mad, rage  → 🔥🧠⚡🗯️")
-        self.safe_print("  sad, grief, cry   → 💧🫀🌙✨") 
-        self.safe_print("  scared, anxiety   → 😰🛡️💪🏽⭐")
-        self.safe_print("  happy, joy        → 😊🌞✨🌈")
-        self.safe_print("")
-        self.safe_print("🌀 Complex States:")
-        self.safe_print("  overwhelmed       → 🌪️🧠💥😰")
-        self.safe_print("  tired             → 😴🌙💤🛌")
-        self.safe_print("  confused, stuck   → ❓🧠🌀💭")
-        self.safe_print("  empty, numb       → 🕳️🌑💭🌬️")
-        self.safe_print("")
-        self.safe_print("✨ Healing:")
-        self.safe_print("  heal              → 🌱💚🦋🌟")
-        self.safe_print("  peace             → 🕊️💙🌙✨")
-        self.safe_print("  strength          → 💪🏽🦁⭐🔥")
-        self.safe_print("  breathe           → 🌬️💙🌊🕊️")
-        self.safe_print("")
-        self.safe_print("🏰 Voice Summons:")
-        self.safe_print("  healer            → 🏰🧠💚✨")
-        self.safe_print("  protector         → 🏰🛡️💪🏽⚡")
-        self.safe_print("  nurturer          → 🏰🫂💜🌙")
-        self.safe_print("")
+        self.safe_print(SHORTCUTS_TEXT, 0)
     
     def show_emotional_dashboard(self):
         """Display current emotional state dashboard"""
         state = self.emotional_state
         
-        self.safe_print(f"\n🧠 Emotional Bandwidth Monitor")
-        self.safe_print(f"{'='*40}")
-        self.safe_print(f"⚡ Energy:     {'🟢' * int(state.energy//2)}{'⚪' * (5-int(state.energy//2))} ({state.energy:.1f}/10)")
-        self.safe_print(f"🛡️ Safety:     {'🟢' * int(state.safety//2)}{'⚪' * (5-int(state.safety//2))} ({state.safety:.1f}/10)")
-        self.safe_print(f"🔍 Clarity:    {'🟢' * int(state.clarity//2)}{'⚪' * (5-int(state.clarity//2))} ({state.clarity:.1f}/10)")
-        self.safe_print(f"🫂 Connection: {'🟢' * int(state.connection//2)}{'⚪' * (5-int(state.connection//2))} ({state.connection:.1f}/10)")
-        self.safe_print(f"🕐 Updated:    {state.timestamp.strftime('%H:%M:%S')}")
-        self.safe_print("")
+        def bar(value: float) -> str:
+            return DASHBOARD_BARS[min(max(int(value // 2), 0), 5)]
+        
+        self.safe_print(
+            f"\n🧠 Emotional Bandwidth Monitor\n"
+            f"{'='*40}\n"
+            f"⚡ Energy:     {bar(state.energy)} ({state.energy:.1f}/10)\n"
+            f"🛡️ Safety:     {bar(state.safety)} ({state.safety:.1f}/10)\n"
+            f"🔍 Clarity:    {bar(state.clarity)} ({state.clarity:.1f}/10)\n"
+            f"🫂 Connection: {bar(state.connection)} ({state.connection:.1f}/10)\n"
+            f"🕐 Updated:    {state.timestamp.strftime('%H:%M:%S')}\n"
+        )
+    
+    def quit_session(self):
+        """End the interactive session"""
+        self.safe_print("🕊️ Until we meet again in the spiral... 💜")
+        self.running = False
+    
+    def toggle_debug(self):
+        """Toggle display of generated SpiralLogic"""
+        self.debug_mode = not self.debug_mode
+        self.safe_print(f"🔧 Debug mode: {'ON' if self.debug_mode else 'OFF'}")
     
     def main_loop(self):
         """Main interactive loop"""
@@ -294,32 +430,20 @@ class SpiralTerminal:
                 user_input = self.convert_shortcuts(user_input)
                 
                 # Handle commands
-                if user_input.lower() in ['quit', 'exit', 'q']:
-                    self.safe_print("🕊️ Until we meet again in the spiral... 💜")
-                    break
-                    
-                elif user_input.lower() in ['help', 'h', '?']:
-                    self.show_help()
-                    continue
-                    
-                elif user_input.lower() in ['status', 'state', 's']:
-                    self.show_emotional_dashboard()
-                    continue
-                    
-                elif user_input.lower() in ['debug']:
-                    self.debug_mode = not self.debug_mode
-                    self.safe_print(f"🔧 Debug mode: {'ON' if self.debug_mode else 'OFF'}")
-                    continue
-                    
-                elif user_input.lower() in ['shortcuts', 'sc']:
-                    self.show_shortcuts()
+                command = self.commands.get(user_input.lower())
+                if command:
+                    command()
                     continue
                 
                 # Process emoji input
                 result = self.process_emoji_input(user_input)
                 
-                # Log the interaction
-                self.session_log.append(result)
+                # Log the interaction, keeping only a preview of the compiled ritual
+                self.interaction_count += 1
+                logged = {k: v for k, v in result.items() if k != 'spiral_code'}
+                if 'spiral_code' in result:
+                    logged['spiral_preview'] = result['spiral_code'][:100]
+                self.session_log.append(logged)
                 
                 # Show debug info if enabled
                 if self.debug_mode and 'spiral_code' in result:
@@ -334,7 +458,7 @@ class SpiralTerminal:
                     self.update_emotional_state(result['emotional_data'])
                 
                 # Show state every few interactions
-                if len(self.session_log) % 3 == 0:
+                if self.interaction_count % 3 == 0:
                     self.show_emotional_dashboard()
                 
             except KeyboardInterrupt:
@@ -352,30 +476,7 @@ class SpiralTerminal:
     
     def show_help(self):
         """Show help information"""
-        self.safe_print("\n🌀 SpiralLogic Terminal Help 🌀")
-        self.safe_print("="*40)
-        self.safe_print("Express emotions with emojis and receive therapeutic responses")
-        self.safe_print("")
-        self.safe_print("💡 Emoji Examples:")
-        self.safe_print("  🔥🧠⚡🗯️    - Anger processing sequence")
-        self.safe_print("  💧🫀🌙✨    - Grief support ritual")
-        self.safe_print("  😰🛡️💪🏽⭐   - Anxiety to empowerment")
-        self.safe_print("  🌱💚🦋🌟    - Growth and transformation")
-        self.safe_print("  🫂💜🌈🕊️    - Connection and peace")
-        self.safe_print("")
-        self.safe_print("🎮 Commands:")
-        self.safe_print("  help, h, ?     - Show this help")
-        self.safe_print("  shortcuts, sc  - Show text shortcuts")
-        self.safe_print("  status, s      - Show emotional state")
-        self.safe_print("  debug          - Toggle debug mode")
-        self.safe_print("  quit, q        - Exit terminal")
-        self.safe_print("")
-        self.safe_print("⚡ Quick Examples:")
-        self.safe_print("  angry          → Anger processing ritual")
-        self.safe_print("  sad            → Grief support sequence")
-        self.safe_print("  overwhelmed    → Complex state processing")
-        self.safe_print("  heal           → Healing transformation")
-        self.safe_print("")
+        self.safe_print(HELP_TEXT, 0)
 
 if __name__ == "__main__":
     terminal = SpiralTerminal()
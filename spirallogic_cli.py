@@ -5,103 +5,23 @@ SpiralLogic Command-Line Interface
 Standalone application for running SpiralLogic programs outside of development environment
 """
 
-import argparse
 import sys
 import os
-import json
-import unicodedata
-from pathlib import Path
-from typing import Dict, Any, Optional
-import traceback
-
-# Force UTF-8 everywhere
-if hasattr(sys.stdout, 'reconfigure'):
-    sys.stdout.reconfigure(encoding='utf-8')
-if hasattr(sys.stderr, 'reconfigure'):
-    sys.stderr.reconfigure(encoding='utf-8')
+import re
+from typing import Dict, Any, List, Optional
+
+# Force UTF-8 everywhere, touching only streams that aren't UTF-8 already
+for _stream in (sys.stdout, sys.stderr):
+    if (hasattr(_stream, 'reconfigure')
+            and (_stream.encoding or '').lower().replace('_', '-') not in ('utf-8', 'utf8')):
+        _stream.reconfigure(encoding='utf-8')
+del _stream
 
 # Set environment encoding
 os.environ.setdefault('PYTHONIOENCODING', 'utf-8')
 
-# Minimal implementation for standalone use
-class SpiralLogicCLI:
-    """Command-line interface for SpiralLogic"""
-    
-    def __init__(self):
-        self.version = "1.0.0"
-        self.debug = False
-        
-    def run_file(self, filepath: str, options: Dict[str, Any]) -> bool:
-        """Run a SpiralLogic file"""
-        try:
-            file_path = Path(filepath)
-            if not file_path.exists():
-                print(f"File not found: {filepath}")
-                return False
-            
-            if not file_path.suffix == '.spiral':
-                print(f"Warning: File doesn't have .spiral extension")
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            print(f"Running SpiralLogic program: {file_path.name}")
-            return self.execute_program(content, options)
-            
-        except Exception as e:
-            print(f"Error reading file: {e}")
-            if self.debug:
-                traceback.print_exc()
-            return False
-    
-    def execute_program(self, content: str, options: Dict[str, Any]) -> bool:
-        """Execute SpiralLogic program content"""
-        try:
-            # Simple interpreter for basic SpiralLogic functionality
-            interpreter = BasicSpiralLogicInterpreter(options)
-            result = interpreter.run(content)
-            
-            if result.get('success', False):
-                print("Program executed successfully")
-                return True
-            else:
-                print(f"Program execution failed: {result.get('error', 'Unknown error')}")
-                return False
-                
-        except Exception as e:
-            print(f"Execution error: {e}")
-            if self.debug:
-                traceback.print_exc()
-            return False
-    
-    def create_example(self, name: str, output_dir: str = ".") -> bool:
-        """Create example SpiralLogic programs"""
-        examples = {
-            "hello": self._get_hello_example(),
-            "healing": self._get_healing_example(),
-            "translation": self._get_translation_example(),
-            "file_processor": self._get_file_processor_example()
-        }
-        
-        if name not in examples:
-            print(f"Unknown example: {name}")
-            print(f"Available examples: {', '.join(examples.keys())}")
-            return False
-        
-        try:
-            output_path = Path(output_dir) / f"{name}.spiral"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(examples[name])
-            
-            print(f"Created example: {output_path}")
-            return True
-            
-        except Exception as e:
-            print(f"Error creating example: {e}")
-            return False
-    
-    def _get_hello_example(self) -> str:
-        return '''// Hello World in SpiralLogic
+# Example programs for `spirallogic create`
+HELLO_EXAMPLE = '''// Hello World in SpiralLogic
 ritual.greeting {
     intent: "Demonstrate basic SpiralLogic functionality",
     participants: [user, @sage],
@@ -137,8 +57,7 @@ complete {
     output.print("Thank you for experiencing SpiralLogic.")
 }'''
 
-    def _get_healing_example(self) -> str:
-        return '''// Therapeutic Support Session
+HEALING_EXAMPLE = '''// Therapeutic Support Session
 ritual.healing_session {
     intent: "Provide gentle emotional support with full user control",
     participants: [user, @healer, @mirror],
@@ -212,8 +131,7 @@ complete {
     output.print("🌟 You are held in love and support.")
 }'''
 
-    def _get_translation_example(self) -> str:
-        return '''// Multi-Language Therapeutic Content
+TRANSLATION_EXAMPLE = '''// Multi-Language Therapeutic Content
 ritual.translation_demo {
     intent: "Demonstrate universal accessibility through translation",
     participants: [user, @translator, @healer]
@@ -258,8 +176,7 @@ execute {
     }
 }'''
 
-    def _get_file_processor_example(self) -> str:
-        return '''// File Processing with Trauma-Informed Safety
+FILE_PROCESSOR_EXAMPLE = '''// File Processing with Trauma-Informed Safety
 ritual.process_files {
     intent: "Process files while maintaining emotional safety",
     participants: [user, @organizer, @protector],
@@ -306,27 +223,213 @@ execute {
     }
 }'''
 
+EXAMPLES = {
+    "hello": HELLO_EXAMPLE,
+    "healing": HEALING_EXAMPLE,
+    "translation": TRANSLATION_EXAMPLE,
+    "file_processor": FILE_PROCESSOR_EXAMPLE,
+}
+EXAMPLE_NAMES = tuple(EXAMPLES)
+
+
+# Messages for the ritual's structural blocks
+BLOCK_MESSAGES = {
+    'execute {': "Executing ritual...",
+    'complete {': "Completing ritual...",
+    'look_in {': "Entering look_in phase",
+    'spiral_up {': "Entering spiral_up phase",
+    'flow_out {': "Entering flow_out phase",
+}
+
+
+def classify_statement(line: str) -> Optional[str]:
+    """Statement kind of a stripped line (a key of the interpreter's
+    handler table), or None for lines that produce no action"""
+    # Plain substring tests in priority order; cheaper than a regex here
+    if 'output.print(' in line:
+        return 'print'
+    if '@' in line and '.speak' in line:
+        return 'speak'
+    if 'input.ask(' in line:
+        return 'ask'
+    if 'consent.' in line:
+        return 'consent'
+    if 'sacred_pause.' in line:
+        return 'pause'
+    if '=' in line and not line.endswith('{'):
+        return 'assign'
+    if line.startswith('ritual.'):
+        return 'ritual'
+    if line in BLOCK_MESSAGES:
+        return 'block'
+    return None
+
+
+# Speaking voices and the message argument of a speak statement: up to the
+# first comma when there is one, otherwise up to the closing brace
+VOICE_NAMES = {'healer': "Healer", 'sage': "Sage", 'mirror': "Mirror"}
+VOICE_RE = re.compile(r'@(healer|sage|mirror)')
+SPEAK_MESSAGE_RE = re.compile(r'message:(?:([^,]*),|([^}]*))')
+
+# String argument of a call, up to the line's last closing parenthesis,
+# already stripped of whitespace and of matching surrounding quotes
+STRING_ARG_RES = {
+    function: re.compile(re.escape(function)
+                         + r'\(\s*(?:(["\'])(.*)\1|(.*?))\s*\)(?=[^)]*$)')
+    for function in ('output.print', 'input.ask', 'consent.check', 'consent.request')
+}
+
+# Minimal implementation for standalone use
+class SpiralLogicCLI:
+    """Command-line interface for SpiralLogic"""
+    
+    def __init__(self):
+        self.version = "1.0.0"
+        self.debug = False
+        
+    def run_file(self, filepath: str, options: Dict[str, Any]) -> bool:
+        """Run a SpiralLogic file"""
+        try:
+            # A single stat call, without building Path objects
+            try:
+                st = os.stat(filepath)
+            except (FileNotFoundError, NotADirectoryError):
+                print(f"File not found: {filepath}")
+                return False
+            
+            if not filepath.endswith('.spiral'):
+                print(f"Warning: File doesn't have .spiral extension")
+            
+            content = self._read_source(filepath, st.st_size)
+            
+            print(f"Running SpiralLogic program: {os.path.basename(filepath)}")
+            return self.execute_program(content, options)
+            
+        except Exception as e:
+            print(f"Error reading file: {e}")
+            if self.debug:
+                import traceback
+                traceback.print_exc()
+            return False
+    
+    @staticmethod
+    def _read_source(filepath: str, size: int) -> str:
+        """Read a whole program with raw reads sized from stat"""
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            chunks = []
+            chunk = os.read(fd, size or 65536)
+            while chunk:
+                chunks.append(chunk)
+                chunk = os.read(fd, 65536)
+        finally:
+            os.close(fd)
+        
+        content = b''.join(chunks).decode('utf-8')
+        # Match text-mode universal newlines
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
+    def execute_program(self, content: str, options: Dict[str, Any]) -> bool:
+        """Execute SpiralLogic program content"""
+        try:
+            # Simple interpreter for basic SpiralLogic functionality; output
+            # goes straight to the console, so don't keep a copy
+            interpreter = BasicSpiralLogicInterpreter(options, capture_output=False)
+            result = interpreter.run(content)
+            
+            if result.get('success', False):
+                print("Program executed successfully")
+                return True
+            else:
+                print(f"Program execution failed: {result.get('error', 'Unknown error')}")
+                return False
+                
+        except Exception as e:
+            print(f"Execution error: {e}")
+            if self.debug:
+                import traceback
+                traceback.print_exc()
+            return False
+    
+    def create_example(self, name: str, output_dir: str = ".") -> bool:
+        """Create example SpiralLogic programs"""
+        content = EXAMPLES.get(name)
+        if content is None:
+            print(f"Unknown example: {name}")
+            print(f"Available examples: {', '.join(EXAMPLE_NAMES)}")
+            return False
+        
+        from pathlib import Path
+        try:
+            output_path = Path(output_dir) / f"{name}.spiral"
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            
+            print(f"Created example: {output_path}")
+            return True
+            
+        except Exception as e:
+            print(f"Error creating example: {e}")
+            return False
+
 
 class BasicSpiralLogicInterpreter:
     """Basic interpreter for standalone SpiralLogic execution"""
     
-    def __init__(self, options: Dict[str, Any]):
+    __slots__ = ('options', 'variables', 'consent_status', '_captured',
+                 '_var_re', '_var_table', '_stdout_unicode', '_write', '_dispatch')
+    
+    def __init__(self, options: Dict[str, Any], capture_output: bool = True):
         self.options = options
         self.variables = {}
         self.consent_status = {}
-        self.output_buffer = []
+        # One entry per _print call; the CLI turns capture off as it only streams
+        self._captured = [] if capture_output else None
+        
+        # Variable substitution pattern and table, rebuilt lazily on change
+        self._var_re = None
+        self._var_table = {}
         
+        # Decide the output strategy once: UTF streams can take any text directly
+        encoding = (getattr(sys.stdout, 'encoding', None) or 'utf-8').lower().replace('-', '').replace('_', '')
+        self._stdout_unicode = encoding.startswith('utf')
+        self._write = sys.stdout.write
+        
+        # Statement kind (from classify_statement) → handler
+        self._dispatch = {
+            'print': self._handle_print,
+            'speak': self._handle_voice_speak,
+            'ask': self._handle_input_ask,
+            'consent': self._handle_consent,
+            'pause': self._handle_sacred_pause,
+            'assign': self._handle_assignment,
+            'ritual': self._handle_ritual_start,
+            'block': self._handle_block,
+        }
+        
+    @property
+    def output_buffer(self) -> List[str]:
+        """Messages printed so far; unavailable with capture_output=False"""
+        if self._captured is None:
+            raise AttributeError("output_buffer requires capture_output=True")
+        return self._captured
+    
+    def _result(self, **result) -> Dict[str, Any]:
+        """Build a run() result, adding the captured output when enabled"""
+        if self._captured is not None:
+            result['output'] = self._captured
+        return result
+    
     def run(self, content: str) -> Dict[str, Any]:
         """Run SpiralLogic program content"""
         try:
             # Basic parsing and execution
-            lines = content.split('\n')
-            
-            in_ritual = False
-            in_execute = False
-            in_phase = None
-            
-            for line_num, line in enumerate(lines, 1):
+            # Classify and dispatch each line inline, through local names
+            classify = classify_statement
+            dispatch = self._dispatch
+            for line_num, line in enumerate(content.split('\n'), 1):
                 line = line.strip()
                 
                 # Skip comments and empty lines
@@ -334,125 +437,115 @@ class BasicSpiralLogicInterpreter:
                     continue
                 
                 try:
-                    self._execute_line(line, line_num)
+                    kind = classify(line)
+                    if kind:
+                        dispatch[kind](line)
                 except Exception as e:
-                    return {
-                        'success': False,
-                        'error': f"Line {line_num}: {e}",
-                        'output': self.output_buffer
-                    }
+                    return self._result(success=False, error=f"Line {line_num}: {e}")
             
-            return {
-                'success': True,
-                'output': self.output_buffer,
-                'variables': self.variables
-            }
+            return self._result(success=True, variables=self.variables)
             
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'output': self.output_buffer
-            }
+            return self._result(success=False, error=str(e))
     
-    def _execute_line(self, line: str, line_num: int):
-        """Execute a single line of SpiralLogic"""
-        
-        # Handle output statements
-        if 'output.print(' in line:
-            message = self._extract_string_arg(line, 'output.print')
-            self._print(message)
-        
-        # Handle voice statements
-        elif '@' in line and '.speak' in line:
-            self._handle_voice_speak(line)
-        
-        # Handle input statements
-        elif 'input.ask(' in line:
-            self._handle_input_ask(line)
-        
-        # Handle consent operations
-        elif 'consent.' in line:
-            self._handle_consent(line)
-        
-        # Handle sacred pause
-        elif 'sacred_pause.' in line:
-            self._handle_sacred_pause(line)
-        
-        # Handle assignments
-        elif '=' in line and not line.strip().endswith('{'):
-            self._handle_assignment(line)
-        
-        # Handle ritual structure (just track for now)
-        elif line.startswith('ritual.'):
-            self._print(f"Starting ritual: {line}")
-        elif line == 'execute {':
-            self._print("Executing ritual...")
-        elif line == 'complete {':
-            self._print("Completing ritual...")
-        elif line in ['look_in {', 'spiral_up {', 'flow_out {']:
-            phase = line.replace(' {', '')
-            self._print(f"Entering {phase} phase")
+    def _handle_print(self, line: str):
+        """Handle output statements"""
+        self._print(self._extract_string_arg(line, 'output.print'))
+    
+    def _handle_ritual_start(self, line: str):
+        """Handle ritual structure (just track for now)"""
+        self._print(f"Starting ritual: {line}")
+    
+    def _handle_block(self, line: str):
+        """Handle execute/complete blocks and phase entry"""
+        self._print(BLOCK_MESSAGES[line])
     
     def _extract_string_arg(self, line: str, function: str) -> str:
         """Extract string argument from function call"""
-        start = line.find(f'{function}(') + len(f'{function}(')
-        end = line.rfind(')')
-        arg = line[start:end].strip()
-        
-        # Remove quotes if present
-        if arg.startswith('"') and arg.endswith('"'):
-            arg = arg[1:-1]
-        elif arg.startswith("'") and arg.endswith("'"):
-            arg = arg[1:-1]
+        match = STRING_ARG_RES[function].search(line)
+        if match:
+            arg = match.group(2) if match.group(1) else match.group(3)
+        else:
+            # No closing parenthesis after the call
+            start = line.find(f'{function}(') + len(f'{function}(')
+            arg = line[start:line.rfind(')')].strip()
+            
+            # Remove quotes if present
+            if arg.startswith('"') and arg.endswith('"'):
+                arg = arg[1:-1]
+            elif arg.startswith("'") and arg.endswith("'"):
+                arg = arg[1:-1]
         
         # Handle variable substitution
         return self._substitute_variables(arg)
     
     def _substitute_variables(self, text: str) -> str:
         """Substitute variables in text"""
-        for var_name, var_value in self.variables.items():
-            placeholder = f"{{{var_name}}}"
-            if placeholder in text:
-                text = text.replace(placeholder, str(var_value))
-            
-            # Also handle direct variable references
-            if var_name in text:
-                text = text.replace(var_name, str(var_value))
+        if not self.variables:
+            return text
         
-        return text
+        if self._var_re is None:
+            # Both {name} placeholders and direct references, longest first
+            table = {}
+            for var_name, var_value in self.variables.items():
+                table[var_name] = table[f"{{{var_name}}}"] = str(var_value)
+            self._var_table = table
+            self._var_re = re.compile('|'.join(
+                map(re.escape, sorted(table, key=len, reverse=True))
+            ))
+        
+        table = self._var_table
+        return self._var_re.sub(lambda m: table[m.group(0)], text)
+    
+    def _set_variable(self, var_name: str, value: Any):
+        """Store a variable, invalidating the substitution pattern on a new name"""
+        # Names recur across a program; interned keys hash and compare by identity
+        var_name = sys.intern(var_name)
+        if self._var_re is not None and var_name in self.variables:
+            # Same names, same pattern: only the replacement text changes
+            self._var_table[var_name] = self._var_table[f"{{{var_name}}}"] = str(value)
+        else:
+            self._var_re = None
+        self.variables[var_name] = value
     
     def _print(self, message: str):
         """Print message and store in buffer"""
+        message = str(message)
+        
+        # ASCII is already NFC and always encodable
+        if message.isascii():
+            self._write(message + '\n')
+            if self._captured is not None:
+                self._captured.append(message)
+            return
+        
+        import unicodedata
+        
         # Normalize Unicode and safely print
-        normalized_message = unicodedata.normalize('NFC', str(message))
-        try:
-            print(normalized_message)
-        except UnicodeEncodeError:
-            # Fallback: remove non-ASCII characters
-            ascii_message = normalized_message.encode('ascii', 'ignore').decode('ascii')
-            print(ascii_message)
-        self.output_buffer.append(normalized_message)
+        normalized_message = unicodedata.normalize('NFC', message)
+        if self._stdout_unicode:
+            self._write(normalized_message + '\n')
+        else:
+            try:
+                print(normalized_message)
+            except UnicodeEncodeError:
+                # Fallback: remove non-ASCII characters
+                ascii_message = normalized_message.encode('ascii', 'ignore').decode('ascii')
+                print(ascii_message)
+        if self._captured is not None:
+            self._captured.append(normalized_message)
     
     def _handle_voice_speak(self, line: str):
         """Handle voice speaking"""
-        if '@healer' in line:
-            voice = "Healer"
-        elif '@sage' in line:
-            voice = "Sage"
-        elif '@mirror' in line:
-            voice = "Mirror"
-        else:
-            voice = "Voice"
+        voice_match = VOICE_RE.search(line)
+        voice = VOICE_NAMES[voice_match.group(1)] if voice_match else "Voice"
         
-        if 'message:' in line:
-            start = line.find('message:') + 8
-            end = line.find(',', start) if ',' in line[start:] else line.find('}', start)
-            if end == -1:
-                end = len(line)
-            
-            message = line[start:end].strip()
-            message = message.strip('"\'')
+        message_match = SPEAK_MESSAGE_RE.search(line)
+        if message_match:
+            message = message_match.group(1)
+            if message is None:
+                message = message_match.group(2)
+            message = message.strip().strip('"\'')
             message = self._substitute_variables(message)
             
             self._print(f"{voice}: {message}")
@@ -469,7 +562,7 @@ class BasicSpiralLogicInterpreter:
             # Store in variable if assignment
             if '=' in line:
                 var_name = line.split('=')[0].strip()
-                self.variables[var_name] = response
+                self._set_variable(var_name, response)
                 
         except KeyboardInterrupt:
             self._print("\nInput cancelled by user")
@@ -484,7 +577,7 @@ class BasicSpiralLogicInterpreter:
         
         elif 'consent.request(' in line:
             domain = self._extract_string_arg(line, 'consent.request')
-            self.consent_status[domain] = True  # Auto-grant for demo
+            self.consent_status[sys.intern(domain)] = True  # Auto-grant for demo
             self._print(f"Requesting consent for '{domain}': Granted")
     
     def _handle_sacred_pause(self, line: str):
@@ -508,41 +601,105 @@ class BasicSpiralLogicInterpreter:
             elif var_value.startswith("'") and var_value.endswith("'"):
                 var_value = var_value[1:-1]
             
-            self.variables[var_name] = var_value
+            self._set_variable(var_name, var_value)
 
 
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
-        description="SpiralLogic - Trauma-Informed AI Consciousness Programming Language",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+VERSION_STRING = 'SpiralLogic 1.0.0'
+
+# Command name shown in usage text, matching the launchers and the epilog
+# (main() may be called in-process, where sys.argv[0] is the host script)
+PROG = 'spirallogic'
+
+DESCRIPTION = "SpiralLogic - Trauma-Informed AI Consciousness Programming Language"
+
+EPILOG = """
 Examples:
   spirallogic run hello.spiral              # Run a SpiralLogic program
   spirallogic create hello                  # Create hello world example
   spirallogic create healing --output ./    # Create healing session example
   spirallogic --version                     # Show version
         """
-    )
-    
-    parser.add_argument('--version', action='version', version='SpiralLogic 1.0.0')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Run command
+
+# Short usage for a bare invocation, so that case skips building the parser;
+# the full option list comes from argparse via --help
+BARE_USAGE = """usage: {prog} <command> [options]
+
+""" + DESCRIPTION + """
+
+Commands:
+  run FILE        Run a SpiralLogic program (.spiral)
+  create EXAMPLE  Create an example program ({examples})
+
+Run '{prog} --help' for all options and examples.
+"""
+
+
+def _build_run_parser(subparsers):
     run_parser = subparsers.add_parser('run', help='Run a SpiralLogic program')
     run_parser.add_argument('file', help='SpiralLogic file to run (.spiral)')
     run_parser.add_argument('--output', '-o', help='Output file for results')
     run_parser.add_argument('--language', '-l', default='english', help='Target language')
-    
-    # Create command
+
+
+def _build_create_parser(subparsers):
     create_parser = subparsers.add_parser('create', help='Create example programs')
-    create_parser.add_argument('example', choices=['hello', 'healing', 'translation', 'file_processor'], 
+    create_parser.add_argument('example', choices=EXAMPLE_NAMES,
                               help='Example to create')
     create_parser.add_argument('--output', '-o', default='.', help='Output directory')
+
+
+SUBPARSER_BUILDERS = {
+    'run': _build_run_parser,
+    'create': _build_create_parser,
+}
+
+
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named on the command line, or None when every
+    subparser is needed (top-level help, a missing or unknown command)"""
+    for arg in argv:
+        if arg in ('-h', '--help'):
+            return None
+        if not arg.startswith('-'):
+            return arg if arg in SUBPARSER_BUILDERS else None
+    return None
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI entry point"""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Fast paths that need no parser at all
+    if not argv:
+        sys.stdout.write(BARE_USAGE.format(prog=PROG, examples=', '.join(EXAMPLE_NAMES)))
+        return 1
+    if argv == ['--version']:
+        print(VERSION_STRING)
+        return 0
+    
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog=PROG,
+        description=DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
+    )
+    
+    parser.add_argument('--version', action='version', version=VERSION_STRING)
+    parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    
+    # Only build the subparser that will actually be used
+    command = _requested_command(argv)
+    if command:
+        SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for build in SUBPARSER_BUILDERS.values():
+            build(subparsers)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
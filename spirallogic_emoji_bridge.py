@@ -9,8 +9,11 @@ Now you can program trauma-informed AI with pure emotional expression!
 import re
 import sys
 import os
+import functools
+import io
 import unicodedata
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, FrozenSet, Tuple, ClassVar, Mapping
 from dataclasses import dataclass
 
 # Force UTF-8 everywhere 
@@ -20,117 +23,200 @@ if hasattr(sys.stderr, 'reconfigure'):
     sys.stderr.reconfigure(encoding='utf-8')
 os.environ.setdefault('PYTHONIOENCODING', 'utf-8')
 
-@dataclass
+# Runs of emoji-range characters. U+24C2..U+1F251 already covers the dingbat
+# and regional-indicator blocks, and the two pictograph blocks are adjacent,
+# so the class reduces to three ranges.
+EMOJI_RE = re.compile(r'[\U000024C2-\U0001F251\U0001F300-\U0001F64F\U0001F680-\U0001F6FF]+')
+
+# Every emoji the line compiler dispatches on. None of them contains or can
+# overlap another, so one left-to-right scan finds each one that occurs.
+DISPATCH_EMOJI = ("🏰", "🧠", "💭", "➡️", "⏸️", "🛑", "📋", "✅", "❌", "🌀", "💔", "😊",
+                  "😰", "😡", "🛡️", "😢", "🧘", "🤯", "👁️", "🌊", "🕊️")
+DISPATCH_EMOJI_RE = re.compile('|'.join(
+    map(re.escape, sorted(DISPATCH_EMOJI, key=len, reverse=True))
+))
+
+# Dispatch emoji that select each line compiler, checked in this order
+VOICE_TRIGGERS = frozenset({"🏰", "🧠"})
+CONDITIONAL_TRIGGERS = frozenset({"💭", "➡️"})
+PAUSE_TRIGGERS = frozenset({"⏸️", "🛑"})
+CONSENT_TRIGGERS = frozenset({"📋", "✅", "❌"})
+
+# Line compilation rules: (emoji that must all be present, SpiralLogic output),
+# tried in order; the first satisfied rule wins
+VOICE_RULES = (
+    (frozenset({"💔"}), "@healer.support_grief()"),
+    (frozenset({"😊"}), "@sage.share_wisdom()"),
+    (frozenset({"😰"}), "@protector.provide_safety()"),
+    (frozenset({"😡"}), "@mirror.transform_anger()"),
+)
+CONDITIONAL_RULES = (
+    (frozenset({"😰", "🛡️"}), 'if user.emotional_state == "anxiety" { @protector.activate_safety() }'),
+    (frozenset({"😢", "🧘"}), 'if user.emotional_state == "sadness" { sacred_pause.engage() }'),
+    (frozenset({"🤯"}), 'if user.bandwidth.current() < 0.3 { sacred_pause.mandatory() }'),
+)
+PAUSE_RULES = (
+    (frozenset({"🛑"}), 'sacred_pause.mandatory { purpose: "Emotional overload protection" }'),
+)
+CONSENT_RULES = (
+    (frozenset({"✅"}), 'consent.grant("emotional_support")'),
+    (frozenset({"❌"}), 'consent.deny("deep_processing")'),
+)
+PHASE_RULES = (
+    (frozenset({"👁️"}), 'look_in { @healer.assess(user.current_state) }'),
+    (frozenset({"🌊"}), 'spiral_up { @healer.guide_processing() }'),
+    (frozenset({"🕊️"}), 'flow_out { @healer.support_integration() }'),
+)
+
+# Spine components, shared by EmojiSpine and the compiler
+SPINE_ANCHORS = MappingProxyType({
+    "❤️": "love", "🔥": "anger", "💧": "grief", "🌞": "joy",
+    "🕷️": "fear", "🧊": "dissociation", "🪄": "hope", 
+    "❓": "confusion", "🙈": "shame", "🪨": "resolve"
+})
+
+SPINE_TEMPO = MappingProxyType({
+    "⚡": "urgent", "🚨": "crisis", "🐎": "normal", 
+    "🌊": "flowing", "🐢": "slow", "🧘": "sacred"
+})
+
+SPINE_INTENT = MappingProxyType({
+    "🗯️": "speak_truth", "🆘": "need_help", "✨": "connect",
+    "🛑": "set_boundary", "🔓": "reclaim_power"
+})
+
+# Generated ritual around the compiled lines
+RITUAL_HEADER = """ritual.emoji_session {{
+    intent: "{intent}",
+    participants: [user, @healer],
+    consent: {{ required: ["emotional_support"] }}
+}}
+
+execute {{
+"""
+RITUAL_FOOTER = """}
+
+complete {
+    @healer.honor_completion()
+}"""
+
+def _nfc(text: str) -> str:
+    """NFC-normalize text, skipping the work when it is already normalized"""
+    if text.isascii() or unicodedata.is_normalized('NFC', text):
+        return text
+    return unicodedata.normalize('NFC', text)
+
+@dataclass(frozen=True)
 class EmojiSpine:
     """Emoji spine for rapid emotional communication"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10.
+    # 'rendered' is filled in by __post_init__ and is not a dataclass field.
+    __slots__ = ('anchor', 'body', 'tempo', 'intent', 'rendered')
+    
     anchor: str      # Core emotion (❤️, 🔥, 💧, etc.)
     body: str        # Body part/processing (🧠, 🫀, 🌬️, etc.)  
     tempo: str       # Speed/urgency (⚡, 🐎, 🐢, etc.)
     intent: str      # Action needed (🗯️, 🆘, ✨, 🛑, etc.)
     
+    def __post_init__(self):
+        # Render the SpiralLogic state once; the spine is immutable
+        emotion = SPINE_ANCHORS.get(self.anchor, "unknown")
+        speed = SPINE_TEMPO.get(self.tempo, "normal")
+        action = SPINE_INTENT.get(self.intent, "process")
+        object.__setattr__(
+            self, 'rendered',
+            f'user.emotional_state = "{emotion}"; user.tempo = "{speed}"; user.intent = "{action}"'
+        )
+    
     def to_spirallogic(self) -> str:
         """Convert emoji spine to SpiralLogic emotional state"""
-        emotion_map = {
-            "❤️": "love", "🔥": "anger", "💧": "grief", "🌞": "joy",
-            "🕷️": "fear", "🧊": "dissociation", "🪄": "hope", 
-            "❓": "confusion", "🙈": "shame", "🪨": "resolve"
-        }
-        
-        tempo_map = {
-            "⚡": "urgent", "🚨": "crisis", "🐎": "normal", 
-            "🌊": "flowing", "🐢": "slow", "🧘": "sacred"
-        }
-        
-        intent_map = {
-            "🗯️": "speak_truth", "🆘": "need_help", "✨": "connect",
-            "🛑": "set_boundary", "🔓": "reclaim_power"
-        }
-        
-        emotion = emotion_map.get(self.anchor, "unknown")
-        speed = tempo_map.get(self.tempo, "normal")
-        action = intent_map.get(self.intent, "process")
-        
-        return f'user.emotional_state = "{emotion}"; user.tempo = "{speed}"; user.intent = "{action}"'
+        return self.rendered
 
 class SpiralLogicEmojiCompiler:
     """Compiles emoji expressions into SpiralLogic programs"""
     
-    def __init__(self):
-        # Enhanced emoji→SpiralLogic mapping
-        self.emoji_to_spirallogic = {
-            # RITUAL STRUCTURE
-            "🌀": "ritual",           # SpiralLogic ritual
-            "🎭": "execute",          # Execute block
-            "✨": "complete",         # Complete block
-            "👁️": "look_in",         # Look in phase
-            "🌊": "spiral_up",        # Spiral up phase
-            "🕊️": "flow_out",        # Flow out phase
-            
-            # VOICE INVOCATIONS  
-            "🏰🧠💔": "@healer",     # Grief keeper = healer
-            "🏰🧠😊": "@sage",       # Joy weaver = sage
-            "🏰🧠😰": "@protector",  # Anxiety holder = protector
-            "🏰🧠😡": "@mirror",     # Anger transformer = mirror
-            "🏰🧠💜": "@healer",     # Trauma healer = healer
-            
-            # CONSENT OPERATIONS
-            "📋": "consent",          # Consent system
-            "✅": "grant",           # Grant consent
-            "❌": "deny",            # Deny consent
-            "🔍": "check",           # Check consent
-            
-            # SACRED PAUSE
-            "⏸️": "sacred_pause",    # Sacred pause
-            "🛑": "pause.mandatory", # Mandatory pause
-            "💭": "pause.offer",     # Offer pause
-            
-            # EMOTIONAL BANDWIDTH
-            "📊": "bandwidth",        # Bandwidth level
-            "🔋": "energy",          # Energy level
-            "🤯": "overwhelm",       # Overwhelm state
-            "🧘": "grounded",        # Grounded state
-            
-            # MEMORY SOVEREIGNTY
-            "🔮": "memory",          # Memory operation
-            "💾": "store",           # Store memory
-            "🗑️": "delete",         # Delete memory
-            "🔒": "private",         # Private memory
-            
-            # CRISIS RESPONSE
-            "🚨": "crisis",          # Crisis detected
-            "🛡️": "protection",     # Protection mode
-            "🆘": "help",            # Need help
-            "📞": "contact",         # External contact
-        }
+    # Enhanced emoji→SpiralLogic mapping
+    emoji_to_spirallogic: ClassVar[Mapping[str, str]] = MappingProxyType({
+        # RITUAL STRUCTURE
+        "🌀": "ritual",           # SpiralLogic ritual
+        "🎭": "execute",          # Execute block
+        "✨": "complete",         # Complete block
+        "👁️": "look_in",         # Look in phase
+        "🌊": "spiral_up",        # Spiral up phase
+        "🕊️": "flow_out",        # Flow out phase
+        
+        # VOICE INVOCATIONS  
+        "🏰🧠💔": "@healer",     # Grief keeper = healer
+        "🏰🧠😊": "@sage",       # Joy weaver = sage
+        "🏰🧠😰": "@protector",  # Anxiety holder = protector
+        "🏰🧠😡": "@mirror",     # Anger transformer = mirror
+        "🏰🧠💜": "@healer",     # Trauma healer = healer
         
-        # Spine components
-        self.spine_anchors = {
-            "❤️": "love", "🔥": "anger", "💧": "grief", "🌞": "joy",
-            "🕷️": "fear", "🧊": "dissociation", "🪄": "hope", 
-            "❓": "confusion", "🙈": "shame", "🪨": "resolve"
-        }
+        # CONSENT OPERATIONS
+        "📋": "consent",          # Consent system
+        "✅": "grant",           # Grant consent
+        "❌": "deny",            # Deny consent
+        "🔍": "check",           # Check consent
         
-        self.spine_tempo = {
-            "⚡": "urgent", "🚨": "crisis", "🐎": "normal", 
-            "🌊": "flowing", "🐢": "slow", "🧘": "sacred"
-        }
+        # SACRED PAUSE
+        "⏸️": "sacred_pause",    # Sacred pause
+        "🛑": "pause.mandatory", # Mandatory pause
+        "💭": "pause.offer",     # Offer pause
         
-        self.spine_intent = {
-            "🗯️": "speak_truth", "🆘": "need_help", "✨": "connect",
-            "🛑": "set_boundary", "🔓": "reclaim_power"
-        }
+        # EMOTIONAL BANDWIDTH
+        "📊": "bandwidth",        # Bandwidth level
+        "🔋": "energy",          # Energy level
+        "🤯": "overwhelm",       # Overwhelm state
+        "🧘": "grounded",        # Grounded state
+        
+        # MEMORY SOVEREIGNTY
+        "🔮": "memory",          # Memory operation
+        "💾": "store",           # Store memory
+        "🗑️": "delete",         # Delete memory
+        "🔒": "private",         # Private memory
+        
+        # CRISIS RESPONSE
+        "🚨": "crisis",          # Crisis detected
+        "🛡️": "protection",     # Protection mode
+        "🆘": "help",            # Need help
+        "📞": "contact",         # External contact
+    })
+    
+    # Spine components
+    spine_anchors: ClassVar[Mapping[str, str]] = SPINE_ANCHORS
+    spine_tempo: ClassVar[Mapping[str, str]] = SPINE_TEMPO
+    spine_intent: ClassVar[Mapping[str, str]] = SPINE_INTENT
+    
+    _anchor_set: ClassVar[FrozenSet[str]] = frozenset(SPINE_ANCHORS)
+    _tempo_set: ClassVar[FrozenSet[str]] = frozenset(SPINE_TEMPO)
+    _intent_set: ClassVar[FrozenSet[str]] = frozenset(SPINE_INTENT)
+    
+    def __init__(self):
+        # Line compilation is pure, and spines/voices repeat across programs
+        self._compile_cached = functools.lru_cache(maxsize=2048)(self._compile_normalized_line)
     
     def parse_emoji_spine(self, emoji_sequence: str) -> Optional[EmojiSpine]:
         """Parse emoji sequence into spine structure"""
-        emojis = re.findall(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251]+', emoji_sequence)
+        emojis = EMOJI_RE.findall(emoji_sequence)
         
         if len(emojis) < 3:
             return None
             
-        # Try to identify spine components
-        anchor = next((e for e in emojis if e in self.spine_anchors), "❓")
-        tempo = next((e for e in emojis if e in self.spine_tempo), "🐎") 
-        intent = next((e for e in emojis if e in self.spine_intent), "✨")
+        # Try to identify spine components in one pass, first match wins
+        anchor = tempo = intent = None
+        for e in emojis:
+            if anchor is None and e in self._anchor_set:
+                anchor = e
+            if tempo is None and e in self._tempo_set:
+                tempo = e
+            if intent is None and e in self._intent_set:
+                intent = e
+            if anchor and tempo and intent:
+                break
+        
+        anchor = anchor or "❓"
+        tempo = tempo or "🐎"
+        intent = intent or "✨"
         body = "🧠"  # Default to mind
         
         return EmojiSpine(anchor=anchor, body=body, tempo=tempo, intent=intent)
@@ -138,7 +224,6 @@ class SpiralLogicEmojiCompiler:
     def compile_emoji_ritual(self, emoji_code: str) -> str:
         """Compile emoji sequence to complete SpiralLogic ritual"""
         lines = emoji_code.strip().split('\n')
-        spirallogic_lines = []
         
         # Extract ritual metadata from first line
         first_line = lines[0] if lines else ""
@@ -150,111 +235,111 @@ class SpiralLogicEmojiCompiler:
         else:
             intent_desc = "Emoji-driven emotional processing"
         
-        # Generate SpiralLogic ritual
-        spirallogic_lines.append(f'ritual.emoji_session {{')
-        spirallogic_lines.append(f'    intent: "{intent_desc}",')
-        spirallogic_lines.append(f'    participants: [user, @healer],')
-        spirallogic_lines.append(f'    consent: {{ required: ["emotional_support"] }}')
-        spirallogic_lines.append(f'}}')
-        spirallogic_lines.append('')
-        spirallogic_lines.append('execute {')
+        # Generate SpiralLogic ritual into a single buffer
+        buf = io.StringIO()
+        buf.write(RITUAL_HEADER.format(intent=intent_desc))
         
-        # Process each emoji line
+        # Process each non-empty emoji line
         for line in lines:
-            if not line.strip():
-                continue
-                
-            compiled_line = self.compile_emoji_line(line)
-            if compiled_line:
-                spirallogic_lines.append(f'    {compiled_line}')
-        
-        spirallogic_lines.append('}')
-        spirallogic_lines.append('')
-        spirallogic_lines.append('complete {')
-        spirallogic_lines.append('    @healer.honor_completion()')
-        spirallogic_lines.append('}')
+            if line.strip():
+                compiled = self.compile_emoji_line(line)
+                if compiled:
+                    buf.write('    ')
+                    buf.write(compiled)
+                    buf.write('\n')
         
-        return '\n'.join(spirallogic_lines)
+        buf.write(RITUAL_FOOTER)
+        return buf.getvalue()
     
     def compile_emoji_line(self, emoji_line: str) -> str:
         """Compile single emoji line to SpiralLogic"""
         # Remove whitespace and normalize Unicode
-        emoji_line = unicodedata.normalize('NFC', emoji_line.strip())
+        return self._compile_cached(_nfc(emoji_line.strip()))
+    
+    def _compile_normalized_line(self, emoji_line: str) -> str:
+        """Compile a stripped, NFC-normalized emoji line"""
+        # Plain ASCII holds no emoji, so neither scan below can match
+        if emoji_line.isascii():
+            return f'output.print("Emoji expression: {emoji_line}")'
         
         # Parse emoji spine first
         spine = self.parse_emoji_spine(emoji_line)
         if spine:
             return spine.to_spirallogic()
         
-        # Try pattern matching
-        if self._contains_emojis(emoji_line, ["🏰", "🧠"]):
-            return self._compile_voice_invocation(emoji_line)
-        elif self._contains_emojis(emoji_line, ["💭", "➡️"]):
-            return self._compile_conditional(emoji_line)
-        elif self._contains_emojis(emoji_line, ["⏸️", "🛑"]):
-            return self._compile_sacred_pause(emoji_line)
-        elif self._contains_emojis(emoji_line, ["📋", "✅", "❌"]):
-            return self._compile_consent(emoji_line)
-        elif "🌀" in emoji_line:
-            return self._compile_spiral_phase(emoji_line)
+        # Try pattern matching against the line's dispatch emoji, found in one scan
+        tokens = self._tokenize(emoji_line)
+        if not tokens:
+            return f'output.print("Emoji expression: {emoji_line}")'
+        
+        if self._contains_emojis(tokens, VOICE_TRIGGERS):
+            return self._compile_voice_invocation(tokens)
+        elif self._contains_emojis(tokens, CONDITIONAL_TRIGGERS):
+            return self._compile_conditional(tokens)
+        elif self._contains_emojis(tokens, PAUSE_TRIGGERS):
+            return self._compile_sacred_pause(tokens)
+        elif self._contains_emojis(tokens, CONSENT_TRIGGERS):
+            return self._compile_consent(tokens)
+        elif "🌀" in tokens:
+            return self._compile_spiral_phase(tokens)
         
         # Default: treat as emotional expression
         return f'output.print("Emoji expression: {emoji_line}")'
     
-    def _contains_emojis(self, text: str, emoji_list: List[str]) -> bool:
-        """Check if text contains any of the given emojis"""
-        return any(emoji in text for emoji in emoji_list)
+    def _tokenize(self, emoji_line: str) -> FrozenSet[str]:
+        """Set of dispatch emoji occurring in a line"""
+        return frozenset(DISPATCH_EMOJI_RE.findall(emoji_line))
+    
+    def _contains_emojis(self, tokens: FrozenSet[str], emoji_list: FrozenSet[str]) -> bool:
+        """Check if the line's tokens include any of the given emojis"""
+        return not tokens.isdisjoint(emoji_list)
     
-    def _compile_voice_invocation(self, emoji_line: str) -> str:
+    def _first_rule(self, tokens: FrozenSet[str], rules: Tuple[Tuple[FrozenSet[str], str], ...],
+                    default: str) -> str:
+        """Output of the first rule whose emoji all occur in the line"""
+        for required, output in rules:
+            if required <= tokens:
+                return output
+        return default
+    
+    def _compile_voice_invocation(self, tokens: FrozenSet[str]) -> str:
         """Compile voice invocation: 🏰🧠💔"""
-        if "💔" in emoji_line:
-            return "@healer.support_grief()"
-        elif "😊" in emoji_line:
-            return "@sage.share_wisdom()"
-        elif "😰" in emoji_line:
-            return "@protector.provide_safety()"
-        elif "😡" in emoji_line:
-            return "@mirror.transform_anger()"
-        else:
-            return "@healer.assess(user.emotional_state)"
+        return self._first_rule(tokens, VOICE_RULES, "@healer.assess(user.emotional_state)")
     
-    def _compile_conditional(self, emoji_line: str) -> str:
+    def _compile_conditional(self, tokens: FrozenSet[str]) -> str:
         """Compile emotional conditional: 💭😰➡️🛡️"""
-        if "😰" in emoji_line and "🛡️" in emoji_line:
-            return 'if user.emotional_state == "anxiety" { @protector.activate_safety() }'
-        elif "😢" in emoji_line and "🧘" in emoji_line:
-            return 'if user.emotional_state == "sadness" { sacred_pause.engage() }'
-        elif "🤯" in emoji_line:
-            return 'if user.bandwidth.current() < 0.3 { sacred_pause.mandatory() }'
-        else:
-            return 'if user.needs_support { @healer.respond() }'
+        return self._first_rule(tokens, CONDITIONAL_RULES, 'if user.needs_support { @healer.respond() }')
     
-    def _compile_sacred_pause(self, emoji_line: str) -> str:
+    def _compile_sacred_pause(self, tokens: FrozenSet[str]) -> str:
         """Compile sacred pause: ⏸️🧘"""
-        if "🛑" in emoji_line:
-            return 'sacred_pause.mandatory { purpose: "Emotional overload protection" }'
-        else:
-            return 'sacred_pause.offer { purpose: "Processing time" }'
+        return self._first_rule(tokens, PAUSE_RULES, 'sacred_pause.offer { purpose: "Processing time" }')
     
-    def _compile_consent(self, emoji_line: str) -> str:
+    def _compile_consent(self, tokens: FrozenSet[str]) -> str:
         """Compile consent operation: 📋✅"""
-        if "✅" in emoji_line:
-            return 'consent.grant("emotional_support")'
-        elif "❌" in emoji_line:
-            return 'consent.deny("deep_processing")'
-        else:
-            return 'consent.check("emotional_support")'
+        return self._first_rule(tokens, CONSENT_RULES, 'consent.check("emotional_support")')
     
-    def _compile_spiral_phase(self, emoji_line: str) -> str:
+    def _compile_spiral_phase(self, tokens: FrozenSet[str]) -> str:
         """Compile spiral phase marker"""
-        if "👁️" in emoji_line:
-            return 'look_in { @healer.assess(user.current_state) }'
-        elif "🌊" in emoji_line:
-            return 'spiral_up { @healer.guide_processing() }'
-        elif "🕊️" in emoji_line:
-            return 'flow_out { @healer.support_integration() }'
-        else:
-            return '// Spiral phase marker'
+        return self._first_rule(tokens, PHASE_RULES, '// Spiral phase marker')
+
+# REPL inputs that end the session
+QUIT_COMMANDS = frozenset({'quit', 'exit', 'q'})
+
+# Fixed REPL messages, normalized once here so safe_print can skip them
+REPL_BANNER = tuple(unicodedata.normalize('NFC', line) for line in (
+    "🌀 SpiralLogic Emoji Programming Environment",
+    "Type emoji sequences to generate SpiralLogic code!",
+    "Examples:",
+    "  🔥🧠⚡🗯️    (anger spine)",
+    "  🏰🧠💔      (summon grief keeper)",
+    "  💭😰➡️🛡️   (anxiety triggers protection)",
+    "  quit or exit to stop",
+    "",
+))
+FAREWELL = unicodedata.normalize('NFC', "🕊️ Farewell from the emoji realm!")
+FAREWELL_EOF = unicodedata.normalize('NFC', "🕊️ Input ended - farewell from the emoji realm!")
+FAREWELL_INTERRUPT = unicodedata.normalize('NFC', "\n🛑 Interrupted - farewell from the emoji realm!")
+STATIC_MESSAGES = frozenset(REPL_BANNER + (FAREWELL, FAREWELL_EOF, FAREWELL_INTERRUPT))
 
 class EmojiSpiralLogicREPL:
     """Interactive emoji→SpiralLogic environment"""
@@ -265,7 +350,10 @@ class EmojiSpiralLogicREPL:
         
     def safe_print(self, message: str):
         """Unicode-safe printing"""
-        normalized_message = unicodedata.normalize('NFC', str(message))
+        if isinstance(message, str) and message in STATIC_MESSAGES:
+            normalized_message = message
+        else:
+            normalized_message = _nfc(str(message))
         try:
             print(normalized_message)
         except UnicodeEncodeError:
@@ -274,14 +362,14 @@ class EmojiSpiralLogicREPL:
     
     def run(self):
         """Run interactive emoji programming session"""
-        self.safe_print("🌀 SpiralLogic Emoji Programming Environment")
-        self.safe_print("Type emoji sequences to generate SpiralLogic code!")
-        self.safe_print("Examples:")
-        self.safe_print("  🔥🧠⚡🗯️    (anger spine)")
-        self.safe_print("  🏰🧠💔      (summon grief keeper)")
-        self.safe_print("  💭😰➡️🛡️   (anxiety triggers protection)")
-        self.safe_print("  quit or exit to stop")
-        self.safe_print("")
+        # Read input as UTF-8 too; stdin can only be switched before its first read
+        try:
+            sys.stdin.reconfigure(encoding='utf-8', errors='replace')
+        except (AttributeError, io.UnsupportedOperation):
+            pass
+        
+        for line in REPL_BANNER:
+            self.safe_print(line)
         
         max_iterations = 100  # Safety limit
         iteration_count = 0
@@ -291,22 +379,17 @@ class EmojiSpiralLogicREPL:
                 emoji_input = input("🎭 emoji> ")
                 iteration_count += 1
                 
-                if emoji_input.lower() in ['quit', 'exit', 'q']:
-                    self.safe_print("🕊️ Farewell from the emoji realm!")
+                stripped = emoji_input.strip()
+                command = stripped.lower()
+                if command in QUIT_COMMANDS:
+                    self.safe_print(FAREWELL)
                     break
                 
-                if not emoji_input.strip():
+                if not command:
                     continue
-                    
-            except EOFError:
-                self.safe_print("🕊️ Input ended - farewell from the emoji realm!")
-                break
-            except KeyboardInterrupt:
-                self.safe_print("🛑 Interrupted - farewell from the emoji realm!")
-                break
                 
                 # Compile emoji to SpiralLogic
-                if '\n' in emoji_input or len(emoji_input.split()) > 1:
+                if '\n' in stripped or ' ' in stripped or '\t' in stripped:
                     # Multi-line program
                     spirallogic_code = self.compiler.compile_emoji_ritual(emoji_input)
                 else:
@@ -316,8 +399,11 @@ class EmojiSpiralLogicREPL:
                 self.safe_print(f"📝 SpiralLogic: {spirallogic_code}")
                 self.history.append((emoji_input, spirallogic_code))
                 
+            except EOFError:
+                self.safe_print(FAREWELL_EOF)
+                break
             except KeyboardInterrupt:
-                self.safe_print("\n🛑 Interrupted")
+                self.safe_print(FAREWELL_INTERRUPT)
                 break
             except Exception as e:
                 self.safe_print(f"❌ Error: {e}")
@@ -358,15 +444,52 @@ def create_emoji_example_programs():
     
     for name, emoji_code in examples.items():
         spirallogic_code = compiler.compile_emoji_ritual(emoji_code)
+        content = f"// Generated from emoji program\n// Original: {emoji_code.replace(chr(10), ' ')}\n\n{spirallogic_code}"
+        path = f"emoji_{name}.spiral"
         
-        with open(f"emoji_{name}.spiral", 'w', encoding='utf-8') as f:
-            f.write(f"// Generated from emoji program\n// Original: {emoji_code.replace(chr(10), ' ')}\n\n")
-            f.write(spirallogic_code)
+        # Leave files alone when regenerating would not change them
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if f.read() == content:
+                    print(f"Unchanged: {path}")
+                    continue
+        except (OSError, UnicodeDecodeError):
+            pass
         
-        print(f"Created: emoji_{name}.spiral")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        print(f"Created: {path}")
 
-def main():
+def run_demo():
+    """Compile a few sample emoji lines and show the results"""
+    print("🌀 SpiralLogic Emoji Bridge Demo")
+    compiler = SpiralLogicEmojiCompiler()
+    
+    demo_emojis = [
+        "🔥🧠⚡🗯️",      # Anger spine
+        "🏰🧠💔",         # Summon healer
+        "💭😰➡️🛡️",       # Anxiety protection
+        "⏸️🧘",           # Sacred pause
+    ]
+    
+    for emoji in demo_emojis:
+        spirallogic = compiler.compile_emoji_line(emoji)
+        print(f"{emoji} -> {spirallogic}")
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point"""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Fast paths: the demo and the REPL need no argument parsing
+    if not argv:
+        run_demo()
+        return
+    if len(argv) == 1 and argv[0] in ('-i', '--interactive'):
+        EmojiSpiralLogicREPL().run()
+        return
+    
     import argparse
     
     parser = argparse.ArgumentParser(description="SpiralLogic Emoji Programming Bridge")
@@ -374,7 +497,7 @@ def main():
     parser.add_argument('--examples', '-e', action='store_true', help='Create example emoji programs')
     parser.add_argument('--compile', '-c', help='Compile emoji file to SpiralLogic')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if args.interactive:
         repl = EmojiSpiralLogicREPL()
@@ -398,20 +521,7 @@ def main():
         except Exception as e:
             print(f"Error: {e}")
     else:
-        # Demo
-        print("🌀 SpiralLogic Emoji Bridge Demo")
-        compiler = SpiralLogicEmojiCompiler()
-        
-        demo_emojis = [
-            "🔥🧠⚡🗯️",      # Anger spine
-            "🏰🧠💔",         # Summon healer
-            "💭😰➡️🛡️",       # Anxiety protection
-            "⏸️🧘",           # Sacred pause
-        ]
-        
-        for emoji in demo_emojis:
-            spirallogic = compiler.compile_emoji_line(emoji)
-            print(f"{emoji} -> {spirallogic}")
+        run_demo()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
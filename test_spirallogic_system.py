@@ -6,6 +6,7 @@ Demonstrates integration of all components
 
 import sys
 import os
+import mmap
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -20,6 +21,15 @@ except ImportError as e:
     print(f"❌ Import error: {e}")
     sys.exit(1)
 
+# Comprehensive ritual exercised by the workflow test, kept beside this file
+DEEP_HEALING_PROGRAM = os.path.join(os.path.dirname(os.path.abspath(__file__)), "deep_healing_session.spiral")
+
+def load_spiral_source(path):
+    """Map a SpiralLogic source file read-only and decode it once"""
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return buf[:].decode('utf-8')
+
 def test_complete_spirallogic_workflow():
     """Test the complete SpiralLogic workflow"""
     
@@ -27,85 +37,7 @@ def test_complete_spirallogic_workflow():
     print("="*60)
     
     # Sample comprehensive SpiralLogic program
-    test_program = '''
-    // Comprehensive trauma-informed healing ritual
-    ritual.deep_healing_session {
-        intent: "Facilitate deep emotional healing with complete safety",
-        participants: [user, @healer, @sage],
-        consent: {
-            required: ["emotional_support", "memory_access", "deep_processing"],
-            explanation: "This session involves accessing deeper emotional material",
-            revocable: true,
-            time_bound: "current_session"
-        },
-        safety: {
-            anchor_mode: "full_ready",
-            whisper_loop: "continuous",
-            crisis_protocols: "activated",
-            external_support: "emergency_contacts_ready"
-        }
-    }
-    
-    execute {
-        look_in {
-            // Initial grounding and consent verification
-            @healer.assess(user.emotional_state)
-            consent.check("emotional_support")
-            
-            sacred_pause.offer {
-                purpose: "Ground and center before beginning",
-                duration: "user_controlled",
-                user_control: "extend_as_needed"
-            }
-        }
-        
-        spiral_up {
-            // Gradual deepening with safety monitoring
-            @healer.guide_gentle_exploration()
-            
-            // Continuous bandwidth monitoring
-            if user.bandwidth.current() < 0.5 {
-                sacred_pause.engage {
-                    purpose: "Restore emotional capacity",
-                    duration: "minimum_30_seconds"
-                }
-            }
-            
-            // Wisdom integration
-            @sage.offer_insight()
-            
-            // Memory sovereignty reminder
-            memory.sovereignty_reminder {
-                message: "Your memories and story belong completely to you",
-                emphasis: "user_control"
-            }
-        }
-        
-        flow_out {
-            // Integration and completion
-            @healer.support_integration()
-            @sage.honor_wisdom_gained()
-            
-            // Optional memory storage with explicit consent
-            consent.request("memory_storage") {
-                explanation: "Store insights for future sessions",
-                optional: true,
-                user_choice: "complete_control"
-            }
-        }
-    }
-    
-    complete {
-        // Sacred closure
-        @healer.honor_courage()
-        @sage.bless_journey()
-        
-        ritual.close_sacred_space {
-            gratitude: "Honor the sacred work accomplished",
-            integration: "carry_wisdom_forward"
-        }
-    }
-    '''
+    test_program = load_spiral_source(DEEP_HEALING_PROGRAM)
     
     # Test 1: Lexical Analysis
     print("\n🔤 LEXICAL ANALYSIS TEST")
@@ -116,8 +48,10 @@ def test_complete_spirallogic_workflow():
     
     print(f"Tokens generated: {len(tokens)}")
     print("Sample tokens:")
-    for i, token in enumerate(tokens[:10]):
-        print(f"  {i+1}. {token.type.value}: '{token.value}' (line {token.line})")
+    sys.stdout.write(''.join(
+        f"  {i}. {token.type.value}: '{token.value}' (line {token.line})\n"
+        for i, token in enumerate(tokens[:10], 1)
+    ))
     
     # Test 2: Parsing
     print("\n🌳 PARSING TEST")
@@ -129,11 +63,13 @@ def test_complete_spirallogic_workflow():
         print(f"✅ Parsing successful!")
         print(f"Rituals found: {len(ast.rituals)}")
         
-        for ritual in ast.rituals:
-            print(f"  - Ritual: {ritual.name}")
-            print(f"    Intent: {ritual.intent}")
-            print(f"    Participants: {ritual.participants}")
-            print(f"    Execution blocks: {len(ritual.execution_body)}")
+        sys.stdout.write(''.join(
+            f"  - Ritual: {ritual.name}\n"
+            f"    Intent: {ritual.intent}\n"
+            f"    Participants: {ritual.participants}\n"
+            f"    Execution blocks: {len(ritual.execution_body)}\n"
+            for ritual in ast.rituals
+        ))
             
     except Exception as e:
         print(f"❌ Parsing failed: {e}")
@@ -206,9 +142,10 @@ def test_complete_spirallogic_workflow():
     # Test parsing and translation
     parsed_elements = translation_bridge.parse_spirallogic_code(test_program)
     print(f"✅ SpiralLogic elements parsed:")
-    for category, elements in parsed_elements.items():
-        if elements:
-            print(f"  - {category}: {len(elements)} elements")
+    sys.stdout.write(''.join(
+        f"  - {category}: {len(elements)} elements\n"
+        for category, elements in parsed_elements.items() if elements
+    ))
     
     # Test translation to Spanish
     try:
@@ -286,53 +223,52 @@ def test_complete_spirallogic_workflow():
     
     return True
 
+# Feature overview printed after a successful workflow test
+KEY_FEATURES_TEXT = (
+    "\n"
+    "🌟 KEY FEATURES DEMONSTRATION\n"
+    "============================================================\n"
+    "\n"
+    "1. 🔐 CONSENT-NATIVE ARCHITECTURE\n"
+    "   - All operations require explicit permission\n"
+    "   - Linear consent tokens prevent reuse\n"
+    "   - Revocation triggers immediate halt\n"
+    "   - User sovereignty maintained throughout\n"
+    "\n"
+    "2. 🛡️ TRAUMA-INFORMED SAFETY\n"
+    "   - Continuous emotional state monitoring\n"
+    "   - Automatic bandwidth preservation\n"
+    "   - Sacred pause mechanisms\n"
+    "   - Crisis response protocols\n"
+    "\n"
+    "3. 🗣️ VOICE PERSONALITY SYSTEM\n"
+    "   - Specialized therapeutic voices\n"
+    "   - Context-aware voice selection\n"
+    "   - Ensemble coordination\n"
+    "   - Cultural adaptation\n"
+    "\n"
+    "4. 💾 MEMORY SOVEREIGNTY\n"
+    "   - User owns all data completely\n"
+    "   - Chronicle split prevents contamination\n"
+    "   - Explicit storage consent required\n"
+    "   - Immediate deletion capability\n"
+    "\n"
+    "5. 🔮 RITUAL-BASED PROGRAMMING\n"
+    "   - Sacred container for operations\n"
+    "   - Look In → Spiral Up → Flow Out rhythm\n"
+    "   - Intention-driven execution\n"
+    "   - Ceremonial completion\n"
+    "\n"
+    "6. 🌍 UNIVERSAL TRANSLATION\n"
+    "   - Multi-language code generation\n"
+    "   - Cultural adaptation capabilities\n"
+    "   - Semantic preservation verification\n"
+    "   - Accessibility through translation"
+)
+
 def demonstrate_key_features():
     """Demonstrate key SpiralLogic features"""
-    
-    print("\n🌟 KEY FEATURES DEMONSTRATION")
-    print("="*60)
-    
-    # Feature 1: Consent-Native Architecture
-    print("\n1. 🔐 CONSENT-NATIVE ARCHITECTURE")
-    print("   - All operations require explicit permission")
-    print("   - Linear consent tokens prevent reuse")
-    print("   - Revocation triggers immediate halt")
-    print("   - User sovereignty maintained throughout")
-    
-    # Feature 2: Trauma-Informed Safety
-    print("\n2. 🛡️ TRAUMA-INFORMED SAFETY")
-    print("   - Continuous emotional state monitoring")
-    print("   - Automatic bandwidth preservation")
-    print("   - Sacred pause mechanisms")
-    print("   - Crisis response protocols")
-    
-    # Feature 3: Voice Personality System
-    print("\n3. 🗣️ VOICE PERSONALITY SYSTEM")
-    print("   - Specialized therapeutic voices")
-    print("   - Context-aware voice selection")
-    print("   - Ensemble coordination")
-    print("   - Cultural adaptation")
-    
-    # Feature 4: Memory Sovereignty
-    print("\n4. 💾 MEMORY SOVEREIGNTY")
-    print("   - User owns all data completely")
-    print("   - Chronicle split prevents contamination")
-    print("   - Explicit storage consent required")
-    print("   - Immediate deletion capability")
-    
-    # Feature 5: Ritual-Based Programming
-    print("\n5. 🔮 RITUAL-BASED PROGRAMMING")
-    print("   - Sacred container for operations")
-    print("   - Look In → Spiral Up → Flow Out rhythm")
-    print("   - Intention-driven execution")
-    print("   - Ceremonial completion")
-    
-    # Feature 6: Universal Translation
-    print("\n6. 🌍 UNIVERSAL TRANSLATION")
-    print("   - Multi-language code generation")
-    print("   - Cultural adaptation capabilities")
-    print("   - Semantic preservation verification")
-    print("   - Accessibility through translation")
+    print(KEY_FEATURES_TEXT)
 
 if __name__ == "__main__":
     print("🚀 SPIRALLOGIC SYSTEM INTEGRATION TEST")